@@ -9,6 +9,8 @@ import os
 import sys
 import subprocess
 import shutil
+import unittest
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 
@@ -24,6 +26,42 @@ def run_command(cmd: list, cwd: Path = None) -> bool:
         return False
 
 
+def run_protoc(args: list) -> bool:
+    """Run protoc in-process via grpc_tools, falling back to a subprocess."""
+    try:
+        from grpc_tools import protoc
+    except ImportError:
+        return run_command(["python3", "-m", "grpc_tools.protoc"] + args)
+    
+    # Mirror `python -m grpc_tools.protoc`, which adds the bundled well-known types
+    proto_include = Path(protoc.__file__).parent / "_proto"
+    rc = protoc.main(["grpc_tools.protoc"] + args + [f"-I{proto_include}"])
+    if rc != 0:
+        print(f"✗ grpc_tools.protoc {' '.join(args)}")
+        return False
+    
+    print(f"✓ grpc_tools.protoc {' '.join(args)}")
+    return True
+
+
+def _needs_regen(proto_dir: Path, generated_dir: Path) -> bool:
+    """Check whether generated protobuf code is missing or older than its .proto sources."""
+    protos = list(proto_dir.glob("*.proto"))
+    if not protos:
+        return True
+    
+    expected = []
+    for proto in protos:
+        expected.append(generated_dir / f"{proto.stem}_pb2.py")
+        expected.append(generated_dir / f"{proto.stem}_pb2_grpc.py")
+    if not all(path.exists() for path in expected):
+        return True
+    
+    newest_input = max(proto.stat().st_mtime for proto in protos)
+    oldest_output = min(path.stat().st_mtime for path in expected)
+    return oldest_output < newest_input
+
+
 def generate_protobuf_code():
     """Generate Python protobuf code."""
     print("Generating protobuf code...")
@@ -35,29 +73,38 @@ def generate_protobuf_code():
     # Ensure generated directory exists
     generated_dir.mkdir(exist_ok=True)
     
+    if not _needs_regen(proto_dir, generated_dir):
+        print("✓ Protobuf code is up to date")
+        return True
+    
     # Generate protobuf code
-    cmd = [
-        "python3", "-m", "grpc_tools.protoc",
+    protoc_args = [
         "-I", str(proto_dir),
         "--python_out", str(generated_dir),
         "--grpc_python_out", str(generated_dir),
         str(proto_dir / "edi_service.proto")
     ]
     
-    if not run_command(cmd):
+    if not run_protoc(protoc_args):
         return False
     
     # Fix imports in generated files
     print("Fixing imports in generated files...")
     for file in generated_dir.glob("*_pb2_grpc.py"):
-        with open(file, 'r') as f:
-            content = f.read()
+        content = file.read_text(encoding="utf-8")
         
-        content = content.replace('import edi_service_pb2', 'from . import edi_service_pb2')
-        content = content.replace('import edi_message_types_pb2', 'from . import edi_message_types_pb2')
+        if 'from . import edi_service_pb2' in content:
+            continue
         
-        with open(file, 'w') as f:
-            f.write(content)
+        fixed = (
+            content
+            .replace('import edi_service_pb2', 'from . import edi_service_pb2')
+            .replace('import edi_message_types_pb2', 'from . import edi_message_types_pb2')
+        )
+        
+        # Leave unchanged files untouched so their mtime stays stable
+        if fixed != content:
+            file.write_text(fixed, encoding="utf-8")
     
     print("✓ Protobuf code generated successfully")
     return True
@@ -86,9 +133,13 @@ def run_tests():
     
     project_root = Path(__file__).parent
     
-    cmd = ["python3", "-m", "unittest", "discover", "-s", "tests", "-v"]
+    # Run in-process rather than spawning another interpreter
+    suite = unittest.defaultTestLoader.discover(
+        str(project_root / "tests"), top_level_dir=str(project_root)
+    )
+    result = unittest.TextTestRunner(verbosity=2).run(suite)
     
-    if run_command(cmd, cwd=project_root):
+    if result.wasSuccessful():
         print("✓ Tests passed successfully")
         return True
     else:
@@ -160,17 +211,23 @@ def main():
     if not install_dependencies():
         success = False
     
+    # Step dependencies:
+    #
+    #   generate_protobuf_code -> install_dependencies -> format_code -+-> lint_code
+    #                                                                  +-> run_tests
+    #
+    # format_code rewrites sources in place, so it must finish before anything
+    # reads them. lint_code and run_tests only read sources and run concurrently.
+    
     # Format code
     if not format_code():
         success = False
     
-    # Lint code
-    if not lint_code():
-        success = False
-    
-    # Run tests
-    if not run_tests():
-        success = False
+    # Lint code and run tests
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        step_futures = [pool.submit(lint_code), pool.submit(run_tests)]
+        if not all([future.result() for future in step_futures]):
+            success = False
     
     # Build Docker image (optional)
     if os.getenv("BUILD_DOCKER", "false").lower() == "true":
@@ -7,6 +7,7 @@ This script demonstrates how to use the EDI gRPC service client.
 
 import os
 import sys
+import asyncio
 import logging
 from pathlib import Path
 
@@ -17,19 +18,30 @@ sys.path.insert(0, str(project_root))
 import grpc
 from generated import edi_service_pb2
 from generated import edi_service_pb2_grpc
-from src.utils import setup_logging
+from src.utils import MAX_MESSAGE_LENGTH, setup_logging
 
 logger = setup_logging(__name__)
 
+# Seconds to wait for the channel to connect before giving up
+CHANNEL_READY_TIMEOUT = 5
 
-def create_channel(host: str = "localhost", port: int = 50051) -> grpc.Channel:
-    """Create a gRPC channel."""
+
+def create_channel(host: str = "localhost", port: int = 50051) -> grpc.aio.Channel:
+    """Create an asyncio gRPC channel."""
     address = f"{host}:{port}"
-    logger.info(f"Connecting to EDI service at {address}")
-    return grpc.insecure_channel(address)
+    logger.info("Connecting to EDI service at %s", address)
+    return grpc.aio.insecure_channel(
+        address,
+        options=[
+            ("grpc.max_send_message_length", MAX_MESSAGE_LENGTH),
+            ("grpc.max_receive_message_length", MAX_MESSAGE_LENGTH),
+        ],
+        # EDI text is highly repetitive and compresses well
+        compression=grpc.Compression.Gzip,
+    )
 
 
-def test_process_edi_message(client: edi_service_pb2_grpc.EdiServiceStub):
+async def test_process_edi_message(client: edi_service_pb2_grpc.EdiServiceStub):
     """Test the ProcessEdiMessage RPC."""
     logger.info("Testing ProcessEdiMessage...")
     
@@ -67,36 +79,41 @@ IEA*1*000000001~"""
     
     try:
         # Call the service
-        response = client.ProcessEdiMessage(request)
+        response = await client.ProcessEdiMessage(request)
         
-        logger.info(f"Processing Status: {response.status}")
-        logger.info(f"Message Type: {response.message_type}")
-        logger.info(f"Processed At: {response.processed_at}")
+        logger.info("Processing Status: %s", response.status)
+        logger.info("Message Type: %s", response.message_type)
+        logger.info("Processed At: %s", response.processed_at)
         
         if response.purchase_order:
             po = response.purchase_order
-            logger.info(f"PO Number: {po.po_number}")
-            logger.info(f"PO Date: {po.po_date}")
-            logger.info(f"Number of Line Items: {len(po.line_items)}")
+            logger.info("PO Number: %s", po.po_number)
+            logger.info("PO Date: %s", po.po_date)
+            logger.info("Number of Line Items: %s", len(po.line_items))
             
-            for item in po.line_items:
-                logger.info(f"  Line {item.line_number}: {item.product.description} - Qty: {item.quantity_ordered.value}")
+            # Skip walking the line items entirely when INFO output is filtered
+            if logger.isEnabledFor(logging.INFO):
+                for item in po.line_items:
+                    logger.info(
+                        "  Line %s: %s - Qty: %s",
+                        item.line_number, item.product.description, item.quantity_ordered.value
+                    )
         
         if response.messages:
             logger.info("Processing Messages:")
             for msg in response.messages:
-                logger.info(f"  {msg.level}: {msg.message}")
+                logger.info("  %s: %s", msg.level, msg.message)
         
         if response.parsed_segments:
-            logger.info(f"Parsed Segments: {len(response.parsed_segments)}")
+            logger.info("Parsed Segments: %s", len(response.parsed_segments))
             
     except grpc.RpcError as e:
-        logger.error(f"gRPC Error: {e.code()} - {e.details()}")
+        logger.error("gRPC Error: %s - %s", e.code(), e.details())
     except Exception as e:
-        logger.error(f"Error: {e}", exc_info=True)
+        logger.error("Error: %s", e, exc_info=True)
 
 
-def test_get_supported_message_types(client: edi_service_pb2_grpc.EdiServiceStub):
+async def test_get_supported_message_types(client: edi_service_pb2_grpc.EdiServiceStub):
     """Test the GetSupportedMessageTypes RPC."""
     logger.info("Testing GetSupportedMessageTypes...")
     
@@ -105,24 +122,24 @@ def test_get_supported_message_types(client: edi_service_pb2_grpc.EdiServiceStub
     )
     
     try:
-        response = client.GetSupportedMessageTypes(request)
+        response = await client.GetSupportedMessageTypes(request)
         
         logger.info("Supported EDI Message Types:")
         for msg_type in response.supported_types:
-            logger.info(f"  {msg_type.code}: {msg_type.name}")
-            logger.info(f"    Description: {msg_type.description}")
-            logger.info(f"    Supported: {msg_type.supported}")
+            logger.info("  %s: %s", msg_type.code, msg_type.name)
+            logger.info("    Description: %s", msg_type.description)
+            logger.info("    Supported: %s", msg_type.supported)
             if msg_type.required_segments:
-                logger.info(f"    Required Segments: {', '.join(msg_type.required_segments)}")
+                logger.info("    Required Segments: %s", ', '.join(msg_type.required_segments))
             logger.info("")
             
     except grpc.RpcError as e:
-        logger.error(f"gRPC Error: {e.code()} - {e.details()}")
+        logger.error("gRPC Error: %s - %s", e.code(), e.details())
     except Exception as e:
-        logger.error(f"Error: {e}", exc_info=True)
+        logger.error("Error: %s", e, exc_info=True)
 
 
-def test_validate_edi_message(client: edi_service_pb2_grpc.EdiServiceStub):
+async def test_validate_edi_message(client: edi_service_pb2_grpc.EdiServiceStub):
     """Test the ValidateEdiMessage RPC."""
     logger.info("Testing ValidateEdiMessage...")
     
@@ -142,25 +159,42 @@ IEA*1*000000001~"""
     )
     
     try:
-        response = client.ValidateEdiMessage(request)
+        response = await client.ValidateEdiMessage(request)
         
-        logger.info(f"Validation Status: {response.status}")
-        logger.info(f"Detected Message Type: {response.detected_message_type}")
-        logger.info(f"EDI Version: {response.edi_version}")
+        logger.info("Validation Status: %s", response.status)
+        logger.info("Detected Message Type: %s", response.detected_message_type)
+        logger.info("EDI Version: %s", response.edi_version)
         
         if response.messages:
             logger.info("Validation Messages:")
             for msg in response.messages:
-                logger.info(f"  {msg.level}: {msg.message}")
+                logger.info("  %s: %s", msg.level, msg.message)
                 if msg.field:
-                    logger.info(f"    Field: {msg.field}")
+                    logger.info("    Field: %s", msg.field)
                 if msg.line_number:
-                    logger.info(f"    Line: {msg.line_number}")
+                    logger.info("    Line: %s", msg.line_number)
                     
     except grpc.RpcError as e:
-        logger.error(f"gRPC Error: {e.code()} - {e.details()}")
+        logger.error("gRPC Error: %s - %s", e.code(), e.details())
     except Exception as e:
-        logger.error(f"Error: {e}", exc_info=True)
+        logger.error("Error: %s", e, exc_info=True)
+
+
+async def run_client(host: str, port: int):
+    """Run all RPC examples against the service."""
+    # Create one channel and client, shared by every call below
+    async with create_channel(host, port) as channel:
+        # Wait for the connection up front so the handshake is not billed
+        # to the first RPC
+        await asyncio.wait_for(channel.channel_ready(), timeout=CHANNEL_READY_TIMEOUT)
+        client = edi_service_pb2_grpc.EdiServiceStub(channel)
+        
+        # Test all RPC methods
+        await test_get_supported_message_types(client)
+        await test_validate_edi_message(client)
+        await test_process_edi_message(client)
+        
+        logger.info("All tests completed successfully!")
 
 
 def main():
@@ -169,23 +203,11 @@ def main():
     host = os.getenv("EDI_SERVICE_HOST", "localhost")
     port = int(os.getenv("EDI_SERVICE_PORT", "50051"))
     
-    # Create channel and client
-    channel = create_channel(host, port)
-    client = edi_service_pb2_grpc.EdiServiceStub(channel)
-    
     try:
-        # Test all RPC methods
-        test_get_supported_message_types(client)
-        test_validate_edi_message(client)
-        test_process_edi_message(client)
-        
-        logger.info("All tests completed successfully!")
-        
+        asyncio.run(run_client(host, port))
     except Exception as e:
-        logger.error(f"Client error: {e}", exc_info=True)
+        logger.error("Client error: %s", e, exc_info=True)
         sys.exit(1)
-    finally:
-        channel.close()
 
 
 if __name__ == "__main__":
@@ -14,7 +14,10 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-from src.edi_service import serve
+# Prefer the native protobuf backend; must be set before protobuf is imported
+os.environ.setdefault("PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION", "upb")
+
+from src.edi_service import ServerConfig, serve
 from src.utils import setup_logging
 
 logger = setup_logging(__name__)
@@ -23,21 +26,19 @@ logger = setup_logging(__name__)
 def main():
     """Main entry point for the server."""
     # Get configuration from environment variables
-    host = os.getenv("EDI_SERVICE_HOST", "localhost")
-    port = int(os.getenv("EDI_SERVICE_PORT", "50051"))
-    max_workers = int(os.getenv("EDI_MAX_WORKERS", "10"))
+    config = ServerConfig.from_env()
     
-    logger.info(f"Starting EDI Service Server")
-    logger.info(f"Host: {host}")
-    logger.info(f"Port: {port}")
-    logger.info(f"Max Workers: {max_workers}")
+    logger.info("Starting EDI Service Server")
+    logger.info("Host: %s", config.host)
+    logger.info("Port: %s", config.port)
+    logger.info("Max Workers: %s", config.max_workers)
     
     try:
-        serve(host, port, max_workers)
+        serve(config)
     except KeyboardInterrupt:
         logger.info("Server stopped by user")
     except Exception as e:
-        logger.error(f"Server error: {e}", exc_info=True)
+        logger.error("Server error: %s", e, exc_info=True)
         sys.exit(1)
 
 
@@ -24,7 +24,7 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x11\x65\x64i_service.proto\x12\x03\x65\x64i\"\xf9\x01\n\x18ProcessEdiMessageRequest\x12\x13\n\x0b\x65\x64i_message\x18\x01 \x01(\t\x12\x14\n\x0cmessage_type\x18\x02 \x01(\t\x12\x13\n\x0b\x63ustomer_id\x18\x03 \x01(\t\x12\'\n\x07options\x18\x04 \x01(\x0b\x32\x16.edi.ProcessingOptions\x12\x41\n\nparameters\x18\x05 \x03(\x0b\x32-.edi.ProcessEdiMessageRequest.ParametersEntry\x1a\x31\n\x0fParametersEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"\xab\x03\n\x19ProcessEdiMessageResponse\x12%\n\x06status\x18\x01 \x01(\x0e\x32\x15.edi.ProcessingStatus\x12\x14\n\x0cmessage_type\x18\x02 \x01(\t\x12\x30\n\x0epurchase_order\x18\x03 \x01(\x0b\x32\x16.edi.PurchaseOrderDataH\x00\x12#\n\x07invoice\x18\x04 \x01(\x0b\x32\x10.edi.InvoiceDataH\x00\x12\x39\n\x13\x61\x64vance_ship_notice\x18\x05 \x01(\x0b\x32\x1a.edi.AdvanceShipNoticeDataH\x00\x12\x46\n\x19\x66unctional_acknowledgment\x18\x06 \x01(\x0b\x32!.edi.FunctionalAcknowledgmentDataH\x00\x12(\n\x08messages\x18\x07 \x03(\x0b\x32\x16.edi.ProcessingMessage\x12\x14\n\x0cprocessed_at\x18\x08 \x01(\t\x12(\n\x0fparsed_segments\x18\t \x03(\x0b\x32\x0f.edi.EdiSegmentB\r\n\x0bparsed_data\"6\n\x1fGetSupportedMessageTypesRequest\x12\x13\n\x0b\x63ustomer_id\x18\x01 \x01(\t\"P\n GetSupportedMessageTypesResponse\x12,\n\x0fsupported_types\x18\x01 \x03(\x0b\x32\x13.edi.EdiMessageType\"[\n\x19ValidateEdiMessageRequest\x12\x13\n\x0b\x65\x64i_message\x18\x01 \x01(\t\x12\x14\n\x0cmessage_type\x18\x02 \x01(\t\x12\x13\n\x0b\x63ustomer_id\x18\x03 \x01(\t\"\xa1\x01\n\x1aValidateEdiMessageResponse\x12%\n\x06status\x18\x01 \x01(\x0e\x32\x15.edi.ProcessingStatus\x12(\n\x08messages\x18\x02 \x03(\x0b\x32\x16.edi.ProcessingMessage\x12\x13\n\x0b\x65\x64i_version\x18\x03 \x01(\t\x12\x1d\n\x15\x64\x65tected_message_type\x18\x04 \x01(\t\"\x8a\x01\n\x0e\x45\x64iMessageType\x12\x0c\n\x04\x63ode\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x03 \x01(\t\x12\x11\n\tsupported\x18\x04 \x01(\x08\x12\x19\n\x11required_segments\x18\x05 \x03(\t\x12\x19\n\x11optional_segments\x18\x06 \x03(\t\"\xa0\x02\n\x11ProcessingOptions\x12\x17\n\x0fvalidate_format\x18\x01 \x01(\x08\x12\x1f\n\x17validate_business_rules\x18\x02 \x01(\x08\x12\x1f\n\x17include_parsing_details\x18\x03 \x01(\x08\x12\x1c\n\x14include_raw_segments\x18\x04 \x01(\x08\x12\x13\n\x0b\x65nvironment\x18\x05 \x01(\t\x12\x45\n\x10validation_rules\x18\x06 \x03(\x0b\x32+.edi.ProcessingOptions.ValidationRulesEntry\x1a\x36\n\x14ValidationRulesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"\x92\x01\n\x11ProcessingMessage\x12 \n\x05level\x18\x01 \x01(\x0e\x32\x11.edi.MessageLevel\x12\x0c\n\x04\x63ode\x18\x02 \x01(\t\x12\x0f\n\x07message\x18\x03 \x01(\t\x12\r\n\x05\x66ield\x18\x04 \x01(\t\x12\x13\n\x0bline_number\x18\x05 \x01(\x05\x12\x18\n\x10\x65lement_position\x18\x06 \x01(\x05\"Y\n\nEdiSegment\x12\x12\n\nsegment_id\x18\x01 \x01(\t\x12\x10\n\x08\x65lements\x18\x02 \x03(\t\x12\x13\n\x0bline_number\x18\x03 \x01(\x05\x12\x10\n\x08position\x18\x04 \x01(\x05\"\x92\x01\n\x05Party\x12\x1e\n\x16\x65ntity_identifier_code\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x1d\n\x15identification_number\x18\x03 \x01(\t\x12\x1d\n\x07\x61\x64\x64ress\x18\x04 \x01(\x0b\x32\x0c.edi.Address\x12\x1d\n\x07\x63ontact\x18\x05 \x01(\x0b\x32\x0c.edi.Contact\"\x8a\x01\n\x07\x41\x64\x64ress\x12\x16\n\x0e\x61\x64\x64ress_line_1\x18\x01 \x01(\t\x12\x16\n\x0e\x61\x64\x64ress_line_2\x18\x02 \x01(\t\x12\x0c\n\x04\x63ity\x18\x03 \x01(\t\x12\x16\n\x0estate_province\x18\x04 \x01(\t\x12\x13\n\x0bpostal_code\x18\x05 \x01(\t\x12\x14\n\x0c\x63ountry_code\x18\x06 \x01(\t\"B\n\x07\x43ontact\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\r\n\x05phone\x18\x02 \x01(\t\x12\r\n\x05\x65mail\x18\x03 \x01(\t\x12\x0b\n\x03\x66\x61x\x18\x04 \x01(\t\"\x81\x01\n\x07Product\x12\x12\n\nproduct_id\x18\x01 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x02 \x01(\t\x12\x17\n\x0fidentifier_type\x18\x03 \x01(\t\x12 \n\x18manufacturer_part_number\x18\x04 \x01(\t\x12\x12\n\nbrand_name\x18\x05 \x01(\t\"W\n\x08Quantity\x12\r\n\x05value\x18\x01 \x01(\x01\x12\x17\n\x0funit_of_measure\x18\x02 \x01(\t\x12#\n\x1bunit_of_measure_description\x18\x03 \x01(\t\"G\n\x05Price\x12\r\n\x05value\x18\x01 \x01(\x01\x12\x15\n\rcurrency_code\x18\x02 \x01(\t\x12\x18\n\x10price_basis_code\x18\x03 \x01(\t\"W\n\x0fReferenceNumber\x12\x16\n\x0ereference_type\x18\x01 \x01(\t\x12\x17\n\x0freference_value\x18\x02 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x03 \x01(\t\"K\n\x08\x44\x61teTime\x12\x0c\n\x04\x64\x61te\x18\x01 \x01(\t\x12\x0c\n\x04time\x18\x02 \x01(\t\x12\x10\n\x08timezone\x18\x03 \x01(\t\x12\x11\n\tqualifier\x18\x04 \x01(\t\"\xd6\x02\n\x0fMonetaryAmounts\x12 \n\x0ctotal_amount\x18\x01 \x01(\x0b\x32\n.edi.Price\x12\x1e\n\ntax_amount\x18\x02 \x01(\x0b\x32\n.edi.Price\x12\"\n\x0e\x66reight_amount\x18\x03 \x01(\x0b\x32\n.edi.Price\x12#\n\x0f\x64iscount_amount\x18\x04 \x01(\x0b\x32\n.edi.Price\x12)\n\x15terms_discount_amount\x18\x05 \x01(\x0b\x32\n.edi.Price\x12G\n\x12\x61\x64\x64itional_amounts\x18\x06 \x03(\x0b\x32+.edi.MonetaryAmounts.AdditionalAmountsEntry\x1a\x44\n\x16\x41\x64\x64itionalAmountsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\x19\n\x05value\x18\x02 \x01(\x0b\x32\n.edi.Price:\x02\x38\x01\"\x86\x03\n\x08LineItem\x12\x13\n\x0bline_number\x18\x01 \x01(\t\x12\x1d\n\x07product\x18\x02 \x01(\x0b\x32\x0c.edi.Product\x12\x1f\n\x08quantity\x18\x03 \x01(\x0b\x32\r.edi.Quantity\x12\x19\n\x05price\x18\x04 \x01(\x0b\x32\n.edi.Price\x12\"\n\x0e\x65xtended_price\x18\x05 \x01(\x0b\x32\n.edi.Price\x12\'\n\x05\x64\x61tes\x18\x06 \x03(\x0b\x32\x18.edi.LineItem.DatesEntry\x12\r\n\x05notes\x18\x07 \x03(\t\x12:\n\x0f\x61\x64\x64itional_data\x18\x08 \x03(\x0b\x32!.edi.LineItem.AdditionalDataEntry\x1a;\n\nDatesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\x1c\n\x05value\x18\x02 \x01(\x0b\x32\r.edi.DateTime:\x02\x38\x01\x1a\x35\n\x13\x41\x64\x64itionalDataEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"\x86\x03\n\x11PurchaseOrderData\x12\x11\n\tpo_number\x18\x01 \x01(\t\x12\x0f\n\x07po_date\x18\x02 \x01(\t\x12\x1b\n\x13requested_ship_date\x18\x03 \x01(\t\x12\x1f\n\x17requested_delivery_date\x18\x04 \x01(\t\x12\x19\n\x05\x62uyer\x18\x05 \x01(\x0b\x32\n.edi.Party\x12\x1a\n\x06seller\x18\x06 \x01(\x0b\x32\n.edi.Party\x12\x1b\n\x07ship_to\x18\x07 \x01(\x0b\x32\n.edi.Party\x12\x1b\n\x07\x62ill_to\x18\x08 \x01(\x0b\x32\n.edi.Party\x12.\n\nline_items\x18\t \x03(\x0b\x32\x1a.edi.PurchaseOrderLineItem\x12.\n\x10monetary_amounts\x18\n \x01(\x0b\x32\x14.edi.MonetaryAmounts\x12\r\n\x05notes\x18\x0b \x03(\t\x12/\n\x11reference_numbers\x18\x0c \x03(\x0b\x32\x14.edi.ReferenceNumber\"\x85\x02\n\x15PurchaseOrderLineItem\x12\x13\n\x0bline_number\x18\x01 \x01(\t\x12\x1d\n\x07product\x18\x02 \x01(\x0b\x32\x0c.edi.Product\x12\'\n\x10quantity_ordered\x18\x03 \x01(\x0b\x32\r.edi.Quantity\x12\x1e\n\nunit_price\x18\x04 \x01(\x0b\x32\n.edi.Price\x12\"\n\x0e\x65xtended_price\x18\x05 \x01(\x0b\x32\n.edi.Price\x12\x1b\n\x13requested_ship_date\x18\x06 \x01(\t\x12\x1f\n\x17requested_delivery_date\x18\x07 \x01(\t\x12\r\n\x05notes\x18\x08 \x03(\t\"\x90\x03\n\x0bInvoiceData\x12\x16\n\x0einvoice_number\x18\x01 \x01(\t\x12\x14\n\x0cinvoice_date\x18\x02 \x01(\t\x12\x10\n\x08\x64ue_date\x18\x03 \x01(\t\x12\x19\n\x11invoice_type_code\x18\x04 \x01(\t\x12\x1b\n\x07\x62ill_to\x18\x05 \x01(\x0b\x32\n.edi.Party\x12\x1c\n\x08remit_to\x18\x06 \x01(\x0b\x32\n.edi.Party\x12\x1d\n\tship_from\x18\x07 \x01(\x0b\x32\n.edi.Party\x12\x1b\n\x07ship_to\x18\x08 \x01(\x0b\x32\n.edi.Party\x12(\n\nline_items\x18\t \x03(\x0b\x32\x14.edi.InvoiceLineItem\x12.\n\x10monetary_amounts\x18\n \x01(\x0b\x32\x14.edi.MonetaryAmounts\x12\x15\n\rpayment_terms\x18\x0b \x01(\t\x12/\n\x11reference_numbers\x18\x0c \x03(\x0b\x32\x14.edi.ReferenceNumber\x12\r\n\x05notes\x18\r \x03(\t\"\xff\x01\n\x0fInvoiceLineItem\x12\x13\n\x0bline_number\x18\x01 \x01(\t\x12\x1d\n\x07product\x18\x02 \x01(\x0b\x32\x0c.edi.Product\x12(\n\x11quantity_invoiced\x18\x03 \x01(\x0b\x32\r.edi.Quantity\x12\x1e\n\nunit_price\x18\x04 \x01(\x0b\x32\n.edi.Price\x12\"\n\x0e\x65xtended_price\x18\x05 \x01(\x0b\x32\n.edi.Price\x12\x14\n\x0cinvoice_date\x18\x06 \x01(\t\x12\r\n\x05notes\x18\x07 \x03(\t\x12%\n\x08tax_info\x18\x08 \x03(\x0b\x32\x13.edi.TaxInformation\"s\n\x0eTaxInformation\x12\x15\n\rtax_type_code\x18\x01 \x01(\t\x12\x1e\n\ntax_amount\x18\x02 \x01(\x0b\x32\n.edi.Price\x12\x10\n\x08tax_rate\x18\x03 \x01(\x01\x12\x18\n\x10tax_jurisdiction\x18\x04 \x01(\t\"\xc8\x02\n\x15\x41\x64vanceShipNoticeData\x12\x13\n\x0bshipment_id\x18\x01 \x01(\t\x12\x15\n\rshipment_date\x18\x02 \x01(\t\x12\x1e\n\x16\x65xpected_delivery_date\x18\x03 \x01(\t\x12\x1d\n\tship_from\x18\x04 \x01(\x0b\x32\n.edi.Party\x12\x1b\n\x07ship_to\x18\x05 \x01(\x0b\x32\n.edi.Party\x12\x1b\n\x07\x62ill_to\x18\x06 \x01(\x0b\x32\n.edi.Party\x12\x1b\n\x07\x63\x61rrier\x18\x07 \x01(\x0b\x32\n.edi.Party\x12-\n\x10shipment_details\x18\x08 \x03(\x0b\x32\x13.edi.ShipmentDetail\x12/\n\x11reference_numbers\x18\t \x03(\x0b\x32\x14.edi.ReferenceNumber\x12\r\n\x05notes\x18\n \x03(\t\"\xbf\x01\n\x0eShipmentDetail\x12\x12\n\npackage_id\x18\x01 \x01(\t\x12\x14\n\x0cpackage_type\x18\x02 \x01(\t\x12\x1d\n\x06weight\x18\x03 \x01(\x0b\x32\r.edi.Quantity\x12*\n\ndimensions\x18\x04 \x01(\x0b\x32\x16.edi.PackageDimensions\x12\x1f\n\x05items\x18\x05 \x03(\x0b\x32\x10.edi.PackageItem\x12\x17\n\x0ftracking_number\x18\x06 \x01(\t\"[\n\x11PackageDimensions\x12\x0e\n\x06length\x18\x01 \x01(\x01\x12\r\n\x05width\x18\x02 \x01(\x01\x12\x0e\n\x06height\x18\x03 \x01(\x01\x12\x17\n\x0funit_of_measure\x18\x04 \x01(\t\"\x82\x01\n\x0bPackageItem\x12\x1d\n\x07product\x18\x01 \x01(\x0b\x32\x0c.edi.Product\x12\'\n\x10quantity_shipped\x18\x02 \x01(\x0b\x32\r.edi.Quantity\x12\x16\n\x0eserial_numbers\x18\x03 \x03(\t\x12\x13\n\x0blot_numbers\x18\x04 \x03(\t\"\x80\x03\n\x1c\x46unctionalAcknowledgmentData\x12#\n\x1boriginal_transaction_set_id\x18\x01 \x01(\t\x12\x1f\n\x17original_control_number\x18\x02 \x01(\t\x12\x1b\n\x13\x61\x63knowledgment_code\x18\x03 \x01(\t\x12\x17\n\x0fprocessing_date\x18\x04 \x01(\t\x12\x17\n\x0fprocessing_time\x18\x05 \x01(\t\x12\x11\n\tsender_id\x18\x06 \x01(\t\x12\x13\n\x0breceiver_id\x18\x07 \x01(\t\x12?\n\x14transaction_set_acks\x18\x08 \x03(\x0b\x32!.edi.TransactionSetAcknowledgment\x12\x30\n\x0csegment_acks\x18\t \x03(\x0b\x32\x1a.edi.SegmentAcknowledgment\x12\x30\n\x0c\x65lement_acks\x18\n \x03(\x0b\x32\x1a.edi.ElementAcknowledgment\"\x87\x01\n\x1cTransactionSetAcknowledgment\x12\x1a\n\x12transaction_set_id\x18\x01 \x01(\t\x12\x16\n\x0e\x63ontrol_number\x18\x02 \x01(\t\x12\x1b\n\x13\x61\x63knowledgment_code\x18\x03 \x01(\t\x12\x16\n\x0e\x65rror_messages\x18\x04 \x03(\t\"r\n\x15SegmentAcknowledgment\x12\x12\n\nsegment_id\x18\x01 \x01(\t\x12\x10\n\x08position\x18\x02 \x01(\x05\x12\x1b\n\x13\x61\x63knowledgment_code\x18\x03 \x01(\t\x12\x16\n\x0e\x65rror_messages\x18\x04 \x03(\t\"m\n\x15\x45lementAcknowledgment\x12\x10\n\x08position\x18\x01 \x01(\x05\x12\r\n\x05value\x18\x02 \x01(\t\x12\x1b\n\x13\x61\x63knowledgment_code\x18\x03 \x01(\t\x12\x16\n\x0e\x65rror_messages\x18\x04 \x03(\t*\xa2\x02\n\x10ProcessingStatus\x12!\n\x1dPROCESSING_STATUS_UNSPECIFIED\x10\x00\x12\x1d\n\x19PROCESSING_STATUS_SUCCESS\x10\x01\x12&\n\"PROCESSING_STATUS_VALIDATION_ERROR\x10\x02\x12#\n\x1fPROCESSING_STATUS_PARSING_ERROR\x10\x03\x12)\n%PROCESSING_STATUS_BUSINESS_RULE_ERROR\x10\x04\x12.\n*PROCESSING_STATUS_UNSUPPORTED_MESSAGE_TYPE\x10\x05\x12$\n PROCESSING_STATUS_INTERNAL_ERROR\x10\x06*y\n\x0cMessageLevel\x12\x1d\n\x19MESSAGE_LEVEL_UNSPECIFIED\x10\x00\x12\x16\n\x12MESSAGE_LEVEL_INFO\x10\x01\x12\x19\n\x15MESSAGE_LEVEL_WARNING\x10\x02\x12\x17\n\x13MESSAGE_LEVEL_ERROR\x10\x03\x32\xa0\x02\n\nEdiService\x12R\n\x11ProcessEdiMessage\x12\x1d.edi.ProcessEdiMessageRequest\x1a\x1e.edi.ProcessEdiMessageResponse\x12g\n\x18GetSupportedMessageTypes\x12$.edi.GetSupportedMessageTypesRequest\x1a%.edi.GetSupportedMessageTypesResponse\x12U\n\x12ValidateEdiMessage\x12\x1e.edi.ValidateEdiMessageRequest\x1a\x1f.edi.ValidateEdiMessageResponseB;Z9github.com/colinleephillips/process-edi-idl/generated/edib\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x11\x65\x64i_service.proto\x12\x03\x65\x64i\"\xf9\x01\n\x18ProcessEdiMessageRequest\x12\x13\n\x0b\x65\x64i_message\x18\x01 \x01(\t\x12\x14\n\x0cmessage_type\x18\x02 \x01(\t\x12\x13\n\x0b\x63ustomer_id\x18\x03 \x01(\t\x12\'\n\x07options\x18\x04 \x01(\x0b\x32\x16.edi.ProcessingOptions\x12\x41\n\nparameters\x18\x05 \x03(\x0b\x32-.edi.ProcessEdiMessageRequest.ParametersEntry\x1a\x31\n\x0fParametersEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"\xab\x03\n\x19ProcessEdiMessageResponse\x12%\n\x06status\x18\x01 \x01(\x0e\x32\x15.edi.ProcessingStatus\x12\x14\n\x0cmessage_type\x18\x02 \x01(\t\x12\x30\n\x0epurchase_order\x18\x03 \x01(\x0b\x32\x16.edi.PurchaseOrderDataH\x00\x12#\n\x07invoice\x18\x04 \x01(\x0b\x32\x10.edi.InvoiceDataH\x00\x12\x39\n\x13\x61\x64vance_ship_notice\x18\x05 \x01(\x0b\x32\x1a.edi.AdvanceShipNoticeDataH\x00\x12\x46\n\x19\x66unctional_acknowledgment\x18\x06 \x01(\x0b\x32!.edi.FunctionalAcknowledgmentDataH\x00\x12(\n\x08messages\x18\x07 \x03(\x0b\x32\x16.edi.ProcessingMessage\x12\x14\n\x0cprocessed_at\x18\x08 \x01(\t\x12(\n\x0fparsed_segments\x18\t \x03(\x0b\x32\x0f.edi.EdiSegmentB\r\n\x0bparsed_data\"P\n\x1dProcessEdiMessageBatchRequest\x12/\n\x08requests\x18\x01 \x03(\x0b\x32\x1d.edi.ProcessEdiMessageRequest\"S\n\x1eProcessEdiMessageBatchResponse\x12\x31\n\tresponses\x18\x01 \x03(\x0b\x32\x1e.edi.ProcessEdiMessageResponse\"o\n\x08\x45\x64iChunk\x12\x0f\n\x07\x63ontent\x18\x01 \x01(\t\x12\x14\n\x0cmessage_type\x18\x02 \x01(\t\x12\x13\n\x0b\x63ustomer_id\x18\x03 \x01(\t\x12\'\n\x07options\x18\x04 \x01(\x0b\x32\x16.edi.ProcessingOptions\"6\n\x1fGetSupportedMessageTypesRequest\x12\x13\n\x0b\x63ustomer_id\x18\x01 \x01(\t\"P\n GetSupportedMessageTypesResponse\x12,\n\x0fsupported_types\x18\x01 \x03(\x0b\x32\x13.edi.EdiMessageType\"[\n\x19ValidateEdiMessageRequest\x12\x13\n\x0b\x65\x64i_message\x18\x01 \x01(\t\x12\x14\n\x0cmessage_type\x18\x02 \x01(\t\x12\x13\n\x0b\x63ustomer_id\x18\x03 \x01(\t\"\xa1\x01\n\x1aValidateEdiMessageResponse\x12%\n\x06status\x18\x01 \x01(\x0e\x32\x15.edi.ProcessingStatus\x12(\n\x08messages\x18\x02 \x03(\x0b\x32\x16.edi.ProcessingMessage\x12\x13\n\x0b\x65\x64i_version\x18\x03 \x01(\t\x12\x1d\n\x15\x64\x65tected_message_type\x18\x04 \x01(\t\"\x8a\x01\n\x0e\x45\x64iMessageType\x12\x0c\n\x04\x63ode\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x03 \x01(\t\x12\x11\n\tsupported\x18\x04 \x01(\x08\x12\x19\n\x11required_segments\x18\x05 \x03(\t\x12\x19\n\x11optional_segments\x18\x06 \x03(\t\"\xa0\x02\n\x11ProcessingOptions\x12\x17\n\x0fvalidate_format\x18\x01 \x01(\x08\x12\x1f\n\x17validate_business_rules\x18\x02 \x01(\x08\x12\x1f\n\x17include_parsing_details\x18\x03 \x01(\x08\x12\x1c\n\x14include_raw_segments\x18\x04 \x01(\x08\x12\x13\n\x0b\x65nvironment\x18\x05 \x01(\t\x12\x45\n\x10validation_rules\x18\x06 \x03(\x0b\x32+.edi.ProcessingOptions.ValidationRulesEntry\x1a\x36\n\x14ValidationRulesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"\x92\x01\n\x11ProcessingMessage\x12 \n\x05level\x18\x01 \x01(\x0e\x32\x11.edi.MessageLevel\x12\x0c\n\x04\x63ode\x18\x02 \x01(\t\x12\x0f\n\x07message\x18\x03 \x01(\t\x12\r\n\x05\x66ield\x18\x04 \x01(\t\x12\x13\n\x0bline_number\x18\x05 \x01(\x05\x12\x18\n\x10\x65lement_position\x18\x06 \x01(\x05\"Y\n\nEdiSegment\x12\x12\n\nsegment_id\x18\x01 \x01(\t\x12\x10\n\x08\x65lements\x18\x02 \x03(\t\x12\x13\n\x0bline_number\x18\x03 \x01(\x05\x12\x10\n\x08position\x18\x04 \x01(\x05\"\x92\x01\n\x05Party\x12\x1e\n\x16\x65ntity_identifier_code\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x1d\n\x15identification_number\x18\x03 \x01(\t\x12\x1d\n\x07\x61\x64\x64ress\x18\x04 \x01(\x0b\x32\x0c.edi.Address\x12\x1d\n\x07\x63ontact\x18\x05 \x01(\x0b\x32\x0c.edi.Contact\"\x8a\x01\n\x07\x41\x64\x64ress\x12\x16\n\x0e\x61\x64\x64ress_line_1\x18\x01 \x01(\t\x12\x16\n\x0e\x61\x64\x64ress_line_2\x18\x02 \x01(\t\x12\x0c\n\x04\x63ity\x18\x03 \x01(\t\x12\x16\n\x0estate_province\x18\x04 \x01(\t\x12\x13\n\x0bpostal_code\x18\x05 \x01(\t\x12\x14\n\x0c\x63ountry_code\x18\x06 \x01(\t\"B\n\x07\x43ontact\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\r\n\x05phone\x18\x02 \x01(\t\x12\r\n\x05\x65mail\x18\x03 \x01(\t\x12\x0b\n\x03\x66\x61x\x18\x04 \x01(\t\"\x81\x01\n\x07Product\x12\x12\n\nproduct_id\x18\x01 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x02 \x01(\t\x12\x17\n\x0fidentifier_type\x18\x03 \x01(\t\x12 \n\x18manufacturer_part_number\x18\x04 \x01(\t\x12\x12\n\nbrand_name\x18\x05 \x01(\t\"W\n\x08Quantity\x12\r\n\x05value\x18\x01 \x01(\x01\x12\x17\n\x0funit_of_measure\x18\x02 \x01(\t\x12#\n\x1bunit_of_measure_description\x18\x03 \x01(\t\"G\n\x05Price\x12\r\n\x05value\x18\x01 \x01(\x01\x12\x15\n\rcurrency_code\x18\x02 \x01(\t\x12\x18\n\x10price_basis_code\x18\x03 \x01(\t\"W\n\x0fReferenceNumber\x12\x16\n\x0ereference_type\x18\x01 \x01(\t\x12\x17\n\x0freference_value\x18\x02 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x03 \x01(\t\"K\n\x08\x44\x61teTime\x12\x0c\n\x04\x64\x61te\x18\x01 \x01(\t\x12\x0c\n\x04time\x18\x02 \x01(\t\x12\x10\n\x08timezone\x18\x03 \x01(\t\x12\x11\n\tqualifier\x18\x04 \x01(\t\"\xd6\x02\n\x0fMonetaryAmounts\x12 \n\x0ctotal_amount\x18\x01 \x01(\x0b\x32\n.edi.Price\x12\x1e\n\ntax_amount\x18\x02 \x01(\x0b\x32\n.edi.Price\x12\"\n\x0e\x66reight_amount\x18\x03 \x01(\x0b\x32\n.edi.Price\x12#\n\x0f\x64iscount_amount\x18\x04 \x01(\x0b\x32\n.edi.Price\x12)\n\x15terms_discount_amount\x18\x05 \x01(\x0b\x32\n.edi.Price\x12G\n\x12\x61\x64\x64itional_amounts\x18\x06 \x03(\x0b\x32+.edi.MonetaryAmounts.AdditionalAmountsEntry\x1a\x44\n\x16\x41\x64\x64itionalAmountsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\x19\n\x05value\x18\x02 \x01(\x0b\x32\n.edi.Price:\x02\x38\x01\"\x86\x03\n\x08LineItem\x12\x13\n\x0bline_number\x18\x01 \x01(\t\x12\x1d\n\x07product\x18\x02 \x01(\x0b\x32\x0c.edi.Product\x12\x1f\n\x08quantity\x18\x03 \x01(\x0b\x32\r.edi.Quantity\x12\x19\n\x05price\x18\x04 \x01(\x0b\x32\n.edi.Price\x12\"\n\x0e\x65xtended_price\x18\x05 \x01(\x0b\x32\n.edi.Price\x12\'\n\x05\x64\x61tes\x18\x06 \x03(\x0b\x32\x18.edi.LineItem.DatesEntry\x12\r\n\x05notes\x18\x07 \x03(\t\x12:\n\x0f\x61\x64\x64itional_data\x18\x08 \x03(\x0b\x32!.edi.LineItem.AdditionalDataEntry\x1a;\n\nDatesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\x1c\n\x05value\x18\x02 \x01(\x0b\x32\r.edi.DateTime:\x02\x38\x01\x1a\x35\n\x13\x41\x64\x64itionalDataEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"\x86\x03\n\x11PurchaseOrderData\x12\x11\n\tpo_number\x18\x01 \x01(\t\x12\x0f\n\x07po_date\x18\x02 \x01(\t\x12\x1b\n\x13requested_ship_date\x18\x03 \x01(\t\x12\x1f\n\x17requested_delivery_date\x18\x04 \x01(\t\x12\x19\n\x05\x62uyer\x18\x05 \x01(\x0b\x32\n.edi.Party\x12\x1a\n\x06seller\x18\x06 \x01(\x0b\x32\n.edi.Party\x12\x1b\n\x07ship_to\x18\x07 \x01(\x0b\x32\n.edi.Party\x12\x1b\n\x07\x62ill_to\x18\x08 \x01(\x0b\x32\n.edi.Party\x12.\n\nline_items\x18\t \x03(\x0b\x32\x1a.edi.PurchaseOrderLineItem\x12.\n\x10monetary_amounts\x18\n \x01(\x0b\x32\x14.edi.MonetaryAmounts\x12\r\n\x05notes\x18\x0b \x03(\t\x12/\n\x11reference_numbers\x18\x0c \x03(\x0b\x32\x14.edi.ReferenceNumber\"\x85\x02\n\x15PurchaseOrderLineItem\x12\x13\n\x0bline_number\x18\x01 \x01(\t\x12\x1d\n\x07product\x18\x02 \x01(\x0b\x32\x0c.edi.Product\x12\'\n\x10quantity_ordered\x18\x03 \x01(\x0b\x32\r.edi.Quantity\x12\x1e\n\nunit_price\x18\x04 \x01(\x0b\x32\n.edi.Price\x12\"\n\x0e\x65xtended_price\x18\x05 \x01(\x0b\x32\n.edi.Price\x12\x1b\n\x13requested_ship_date\x18\x06 \x01(\t\x12\x1f\n\x17requested_delivery_date\x18\x07 \x01(\t\x12\r\n\x05notes\x18\x08 \x03(\t\"\x90\x03\n\x0bInvoiceData\x12\x16\n\x0einvoice_number\x18\x01 \x01(\t\x12\x14\n\x0cinvoice_date\x18\x02 \x01(\t\x12\x10\n\x08\x64ue_date\x18\x03 \x01(\t\x12\x19\n\x11invoice_type_code\x18\x04 \x01(\t\x12\x1b\n\x07\x62ill_to\x18\x05 \x01(\x0b\x32\n.edi.Party\x12\x1c\n\x08remit_to\x18\x06 \x01(\x0b\x32\n.edi.Party\x12\x1d\n\tship_from\x18\x07 \x01(\x0b\x32\n.edi.Party\x12\x1b\n\x07ship_to\x18\x08 \x01(\x0b\x32\n.edi.Party\x12(\n\nline_items\x18\t \x03(\x0b\x32\x14.edi.InvoiceLineItem\x12.\n\x10monetary_amounts\x18\n \x01(\x0b\x32\x14.edi.MonetaryAmounts\x12\x15\n\rpayment_terms\x18\x0b \x01(\t\x12/\n\x11reference_numbers\x18\x0c \x03(\x0b\x32\x14.edi.ReferenceNumber\x12\r\n\x05notes\x18\r \x03(\t\"\xff\x01\n\x0fInvoiceLineItem\x12\x13\n\x0bline_number\x18\x01 \x01(\t\x12\x1d\n\x07product\x18\x02 \x01(\x0b\x32\x0c.edi.Product\x12(\n\x11quantity_invoiced\x18\x03 \x01(\x0b\x32\r.edi.Quantity\x12\x1e\n\nunit_price\x18\x04 \x01(\x0b\x32\n.edi.Price\x12\"\n\x0e\x65xtended_price\x18\x05 \x01(\x0b\x32\n.edi.Price\x12\x14\n\x0cinvoice_date\x18\x06 \x01(\t\x12\r\n\x05notes\x18\x07 \x03(\t\x12%\n\x08tax_info\x18\x08 \x03(\x0b\x32\x13.edi.TaxInformation\"s\n\x0eTaxInformation\x12\x15\n\rtax_type_code\x18\x01 \x01(\t\x12\x1e\n\ntax_amount\x18\x02 \x01(\x0b\x32\n.edi.Price\x12\x10\n\x08tax_rate\x18\x03 \x01(\x01\x12\x18\n\x10tax_jurisdiction\x18\x04 \x01(\t\"\xc8\x02\n\x15\x41\x64vanceShipNoticeData\x12\x13\n\x0bshipment_id\x18\x01 \x01(\t\x12\x15\n\rshipment_date\x18\x02 \x01(\t\x12\x1e\n\x16\x65xpected_delivery_date\x18\x03 \x01(\t\x12\x1d\n\tship_from\x18\x04 \x01(\x0b\x32\n.edi.Party\x12\x1b\n\x07ship_to\x18\x05 \x01(\x0b\x32\n.edi.Party\x12\x1b\n\x07\x62ill_to\x18\x06 \x01(\x0b\x32\n.edi.Party\x12\x1b\n\x07\x63\x61rrier\x18\x07 \x01(\x0b\x32\n.edi.Party\x12-\n\x10shipment_details\x18\x08 \x03(\x0b\x32\x13.edi.ShipmentDetail\x12/\n\x11reference_numbers\x18\t \x03(\x0b\x32\x14.edi.ReferenceNumber\x12\r\n\x05notes\x18\n \x03(\t\"\xbf\x01\n\x0eShipmentDetail\x12\x12\n\npackage_id\x18\x01 \x01(\t\x12\x14\n\x0cpackage_type\x18\x02 \x01(\t\x12\x1d\n\x06weight\x18\x03 \x01(\x0b\x32\r.edi.Quantity\x12*\n\ndimensions\x18\x04 \x01(\x0b\x32\x16.edi.PackageDimensions\x12\x1f\n\x05items\x18\x05 \x03(\x0b\x32\x10.edi.PackageItem\x12\x17\n\x0ftracking_number\x18\x06 \x01(\t\"[\n\x11PackageDimensions\x12\x0e\n\x06length\x18\x01 \x01(\x01\x12\r\n\x05width\x18\x02 \x01(\x01\x12\x0e\n\x06height\x18\x03 \x01(\x01\x12\x17\n\x0funit_of_measure\x18\x04 \x01(\t\"\x82\x01\n\x0bPackageItem\x12\x1d\n\x07product\x18\x01 \x01(\x0b\x32\x0c.edi.Product\x12\'\n\x10quantity_shipped\x18\x02 \x01(\x0b\x32\r.edi.Quantity\x12\x16\n\x0eserial_numbers\x18\x03 \x03(\t\x12\x13\n\x0blot_numbers\x18\x04 \x03(\t\"\x80\x03\n\x1c\x46unctionalAcknowledgmentData\x12#\n\x1boriginal_transaction_set_id\x18\x01 \x01(\t\x12\x1f\n\x17original_control_number\x18\x02 \x01(\t\x12\x1b\n\x13\x61\x63knowledgment_code\x18\x03 \x01(\t\x12\x17\n\x0fprocessing_date\x18\x04 \x01(\t\x12\x17\n\x0fprocessing_time\x18\x05 \x01(\t\x12\x11\n\tsender_id\x18\x06 \x01(\t\x12\x13\n\x0breceiver_id\x18\x07 \x01(\t\x12?\n\x14transaction_set_acks\x18\x08 \x03(\x0b\x32!.edi.TransactionSetAcknowledgment\x12\x30\n\x0csegment_acks\x18\t \x03(\x0b\x32\x1a.edi.SegmentAcknowledgment\x12\x30\n\x0c\x65lement_acks\x18\n \x03(\x0b\x32\x1a.edi.ElementAcknowledgment\"\x87\x01\n\x1cTransactionSetAcknowledgment\x12\x1a\n\x12transaction_set_id\x18\x01 \x01(\t\x12\x16\n\x0e\x63ontrol_number\x18\x02 \x01(\t\x12\x1b\n\x13\x61\x63knowledgment_code\x18\x03 \x01(\t\x12\x16\n\x0e\x65rror_messages\x18\x04 \x03(\t\"r\n\x15SegmentAcknowledgment\x12\x12\n\nsegment_id\x18\x01 \x01(\t\x12\x10\n\x08position\x18\x02 \x01(\x05\x12\x1b\n\x13\x61\x63knowledgment_code\x18\x03 \x01(\t\x12\x16\n\x0e\x65rror_messages\x18\x04 \x03(\t\"m\n\x15\x45lementAcknowledgment\x12\x10\n\x08position\x18\x01 \x01(\x05\x12\r\n\x05value\x18\x02 \x01(\t\x12\x1b\n\x13\x61\x63knowledgment_code\x18\x03 \x01(\t\x12\x16\n\x0e\x65rror_messages\x18\x04 \x03(\t*\xa2\x02\n\x10ProcessingStatus\x12!\n\x1dPROCESSING_STATUS_UNSPECIFIED\x10\x00\x12\x1d\n\x19PROCESSING_STATUS_SUCCESS\x10\x01\x12&\n\"PROCESSING_STATUS_VALIDATION_ERROR\x10\x02\x12#\n\x1fPROCESSING_STATUS_PARSING_ERROR\x10\x03\x12)\n%PROCESSING_STATUS_BUSINESS_RULE_ERROR\x10\x04\x12.\n*PROCESSING_STATUS_UNSUPPORTED_MESSAGE_TYPE\x10\x05\x12$\n PROCESSING_STATUS_INTERNAL_ERROR\x10\x06*y\n\x0cMessageLevel\x12\x1d\n\x19MESSAGE_LEVEL_UNSPECIFIED\x10\x00\x12\x16\n\x12MESSAGE_LEVEL_INFO\x10\x01\x12\x19\n\x15MESSAGE_LEVEL_WARNING\x10\x02\x12\x17\n\x13MESSAGE_LEVEL_ERROR\x10\x03\x32\xcf\x03\n\nEdiService\x12R\n\x11ProcessEdiMessage\x12\x1d.edi.ProcessEdiMessageRequest\x1a\x1e.edi.ProcessEdiMessageResponse\x12g\n\x18GetSupportedMessageTypes\x12$.edi.GetSupportedMessageTypesRequest\x1a%.edi.GetSupportedMessageTypesResponse\x12U\n\x12ValidateEdiMessage\x12\x1e.edi.ValidateEdiMessageRequest\x1a\x1f.edi.ValidateEdiMessageResponse\x12\x61\n\x16ProcessEdiMessageBatch\x12\".edi.ProcessEdiMessageBatchRequest\x1a#.edi.ProcessEdiMessageBatchResponse\x12J\n\x17ProcessEdiMessageStream\x12\r.edi.EdiChunk\x1a\x1e.edi.ProcessEdiMessageResponse(\x01\x42;Z9github.com/colinleephillips/process-edi-idl/generated/edib\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -42,86 +42,92 @@ if not _descriptor._USE_C_DESCRIPTORS:
   _globals['_LINEITEM_DATESENTRY']._serialized_options = b'8\001'
   _globals['_LINEITEM_ADDITIONALDATAENTRY']._loaded_options = None
   _globals['_LINEITEM_ADDITIONALDATAENTRY']._serialized_options = b'8\001'
-  _globals['_PROCESSINGSTATUS']._serialized_start=6270
-  _globals['_PROCESSINGSTATUS']._serialized_end=6560
-  _globals['_MESSAGELEVEL']._serialized_start=6562
-  _globals['_MESSAGELEVEL']._serialized_end=6683
+  _globals['_PROCESSINGSTATUS']._serialized_start=6550
+  _globals['_PROCESSINGSTATUS']._serialized_end=6840
+  _globals['_MESSAGELEVEL']._serialized_start=6842
+  _globals['_MESSAGELEVEL']._serialized_end=6963
   _globals['_PROCESSEDIMESSAGEREQUEST']._serialized_start=27
   _globals['_PROCESSEDIMESSAGEREQUEST']._serialized_end=276
   _globals['_PROCESSEDIMESSAGEREQUEST_PARAMETERSENTRY']._serialized_start=227
   _globals['_PROCESSEDIMESSAGEREQUEST_PARAMETERSENTRY']._serialized_end=276
   _globals['_PROCESSEDIMESSAGERESPONSE']._serialized_start=279
   _globals['_PROCESSEDIMESSAGERESPONSE']._serialized_end=706
-  _globals['_GETSUPPORTEDMESSAGETYPESREQUEST']._serialized_start=708
-  _globals['_GETSUPPORTEDMESSAGETYPESREQUEST']._serialized_end=762
-  _globals['_GETSUPPORTEDMESSAGETYPESRESPONSE']._serialized_start=764
-  _globals['_GETSUPPORTEDMESSAGETYPESRESPONSE']._serialized_end=844
-  _globals['_VALIDATEEDIMESSAGEREQUEST']._serialized_start=846
-  _globals['_VALIDATEEDIMESSAGEREQUEST']._serialized_end=937
-  _globals['_VALIDATEEDIMESSAGERESPONSE']._serialized_start=940
-  _globals['_VALIDATEEDIMESSAGERESPONSE']._serialized_end=1101
-  _globals['_EDIMESSAGETYPE']._serialized_start=1104
-  _globals['_EDIMESSAGETYPE']._serialized_end=1242
-  _globals['_PROCESSINGOPTIONS']._serialized_start=1245
-  _globals['_PROCESSINGOPTIONS']._serialized_end=1533
-  _globals['_PROCESSINGOPTIONS_VALIDATIONRULESENTRY']._serialized_start=1479
-  _globals['_PROCESSINGOPTIONS_VALIDATIONRULESENTRY']._serialized_end=1533
-  _globals['_PROCESSINGMESSAGE']._serialized_start=1536
-  _globals['_PROCESSINGMESSAGE']._serialized_end=1682
-  _globals['_EDISEGMENT']._serialized_start=1684
-  _globals['_EDISEGMENT']._serialized_end=1773
-  _globals['_PARTY']._serialized_start=1776
-  _globals['_PARTY']._serialized_end=1922
-  _globals['_ADDRESS']._serialized_start=1925
-  _globals['_ADDRESS']._serialized_end=2063
-  _globals['_CONTACT']._serialized_start=2065
-  _globals['_CONTACT']._serialized_end=2131
-  _globals['_PRODUCT']._serialized_start=2134
-  _globals['_PRODUCT']._serialized_end=2263
-  _globals['_QUANTITY']._serialized_start=2265
-  _globals['_QUANTITY']._serialized_end=2352
-  _globals['_PRICE']._serialized_start=2354
-  _globals['_PRICE']._serialized_end=2425
-  _globals['_REFERENCENUMBER']._serialized_start=2427
-  _globals['_REFERENCENUMBER']._serialized_end=2514
-  _globals['_DATETIME']._serialized_start=2516
-  _globals['_DATETIME']._serialized_end=2591
-  _globals['_MONETARYAMOUNTS']._serialized_start=2594
-  _globals['_MONETARYAMOUNTS']._serialized_end=2936
-  _globals['_MONETARYAMOUNTS_ADDITIONALAMOUNTSENTRY']._serialized_start=2868
-  _globals['_MONETARYAMOUNTS_ADDITIONALAMOUNTSENTRY']._serialized_end=2936
-  _globals['_LINEITEM']._serialized_start=2939
-  _globals['_LINEITEM']._serialized_end=3329
-  _globals['_LINEITEM_DATESENTRY']._serialized_start=3215
-  _globals['_LINEITEM_DATESENTRY']._serialized_end=3274
-  _globals['_LINEITEM_ADDITIONALDATAENTRY']._serialized_start=3276
-  _globals['_LINEITEM_ADDITIONALDATAENTRY']._serialized_end=3329
-  _globals['_PURCHASEORDERDATA']._serialized_start=3332
-  _globals['_PURCHASEORDERDATA']._serialized_end=3722
-  _globals['_PURCHASEORDERLINEITEM']._serialized_start=3725
-  _globals['_PURCHASEORDERLINEITEM']._serialized_end=3986
-  _globals['_INVOICEDATA']._serialized_start=3989
-  _globals['_INVOICEDATA']._serialized_end=4389
-  _globals['_INVOICELINEITEM']._serialized_start=4392
-  _globals['_INVOICELINEITEM']._serialized_end=4647
-  _globals['_TAXINFORMATION']._serialized_start=4649
-  _globals['_TAXINFORMATION']._serialized_end=4764
-  _globals['_ADVANCESHIPNOTICEDATA']._serialized_start=4767
-  _globals['_ADVANCESHIPNOTICEDATA']._serialized_end=5095
-  _globals['_SHIPMENTDETAIL']._serialized_start=5098
-  _globals['_SHIPMENTDETAIL']._serialized_end=5289
-  _globals['_PACKAGEDIMENSIONS']._serialized_start=5291
-  _globals['_PACKAGEDIMENSIONS']._serialized_end=5382
-  _globals['_PACKAGEITEM']._serialized_start=5385
-  _globals['_PACKAGEITEM']._serialized_end=5515
-  _globals['_FUNCTIONALACKNOWLEDGMENTDATA']._serialized_start=5518
-  _globals['_FUNCTIONALACKNOWLEDGMENTDATA']._serialized_end=5902
-  _globals['_TRANSACTIONSETACKNOWLEDGMENT']._serialized_start=5905
-  _globals['_TRANSACTIONSETACKNOWLEDGMENT']._serialized_end=6040
-  _globals['_SEGMENTACKNOWLEDGMENT']._serialized_start=6042
-  _globals['_SEGMENTACKNOWLEDGMENT']._serialized_end=6156
-  _globals['_ELEMENTACKNOWLEDGMENT']._serialized_start=6158
-  _globals['_ELEMENTACKNOWLEDGMENT']._serialized_end=6267
-  _globals['_EDISERVICE']._serialized_start=6686
-  _globals['_EDISERVICE']._serialized_end=6974
+  _globals['_PROCESSEDIMESSAGEBATCHREQUEST']._serialized_start=708
+  _globals['_PROCESSEDIMESSAGEBATCHREQUEST']._serialized_end=788
+  _globals['_PROCESSEDIMESSAGEBATCHRESPONSE']._serialized_start=790
+  _globals['_PROCESSEDIMESSAGEBATCHRESPONSE']._serialized_end=873
+  _globals['_EDICHUNK']._serialized_start=875
+  _globals['_EDICHUNK']._serialized_end=986
+  _globals['_GETSUPPORTEDMESSAGETYPESREQUEST']._serialized_start=988
+  _globals['_GETSUPPORTEDMESSAGETYPESREQUEST']._serialized_end=1042
+  _globals['_GETSUPPORTEDMESSAGETYPESRESPONSE']._serialized_start=1044
+  _globals['_GETSUPPORTEDMESSAGETYPESRESPONSE']._serialized_end=1124
+  _globals['_VALIDATEEDIMESSAGEREQUEST']._serialized_start=1126
+  _globals['_VALIDATEEDIMESSAGEREQUEST']._serialized_end=1217
+  _globals['_VALIDATEEDIMESSAGERESPONSE']._serialized_start=1220
+  _globals['_VALIDATEEDIMESSAGERESPONSE']._serialized_end=1381
+  _globals['_EDIMESSAGETYPE']._serialized_start=1384
+  _globals['_EDIMESSAGETYPE']._serialized_end=1522
+  _globals['_PROCESSINGOPTIONS']._serialized_start=1525
+  _globals['_PROCESSINGOPTIONS']._serialized_end=1813
+  _globals['_PROCESSINGOPTIONS_VALIDATIONRULESENTRY']._serialized_start=1759
+  _globals['_PROCESSINGOPTIONS_VALIDATIONRULESENTRY']._serialized_end=1813
+  _globals['_PROCESSINGMESSAGE']._serialized_start=1816
+  _globals['_PROCESSINGMESSAGE']._serialized_end=1962
+  _globals['_EDISEGMENT']._serialized_start=1964
+  _globals['_EDISEGMENT']._serialized_end=2053
+  _globals['_PARTY']._serialized_start=2056
+  _globals['_PARTY']._serialized_end=2202
+  _globals['_ADDRESS']._serialized_start=2205
+  _globals['_ADDRESS']._serialized_end=2343
+  _globals['_CONTACT']._serialized_start=2345
+  _globals['_CONTACT']._serialized_end=2411
+  _globals['_PRODUCT']._serialized_start=2414
+  _globals['_PRODUCT']._serialized_end=2543
+  _globals['_QUANTITY']._serialized_start=2545
+  _globals['_QUANTITY']._serialized_end=2632
+  _globals['_PRICE']._serialized_start=2634
+  _globals['_PRICE']._serialized_end=2705
+  _globals['_REFERENCENUMBER']._serialized_start=2707
+  _globals['_REFERENCENUMBER']._serialized_end=2794
+  _globals['_DATETIME']._serialized_start=2796
+  _globals['_DATETIME']._serialized_end=2871
+  _globals['_MONETARYAMOUNTS']._serialized_start=2874
+  _globals['_MONETARYAMOUNTS']._serialized_end=3216
+  _globals['_MONETARYAMOUNTS_ADDITIONALAMOUNTSENTRY']._serialized_start=3148
+  _globals['_MONETARYAMOUNTS_ADDITIONALAMOUNTSENTRY']._serialized_end=3216
+  _globals['_LINEITEM']._serialized_start=3219
+  _globals['_LINEITEM']._serialized_end=3609
+  _globals['_LINEITEM_DATESENTRY']._serialized_start=3495
+  _globals['_LINEITEM_DATESENTRY']._serialized_end=3554
+  _globals['_LINEITEM_ADDITIONALDATAENTRY']._serialized_start=3556
+  _globals['_LINEITEM_ADDITIONALDATAENTRY']._serialized_end=3609
+  _globals['_PURCHASEORDERDATA']._serialized_start=3612
+  _globals['_PURCHASEORDERDATA']._serialized_end=4002
+  _globals['_PURCHASEORDERLINEITEM']._serialized_start=4005
+  _globals['_PURCHASEORDERLINEITEM']._serialized_end=4266
+  _globals['_INVOICEDATA']._serialized_start=4269
+  _globals['_INVOICEDATA']._serialized_end=4669
+  _globals['_INVOICELINEITEM']._serialized_start=4672
+  _globals['_INVOICELINEITEM']._serialized_end=4927
+  _globals['_TAXINFORMATION']._serialized_start=4929
+  _globals['_TAXINFORMATION']._serialized_end=5044
+  _globals['_ADVANCESHIPNOTICEDATA']._serialized_start=5047
+  _globals['_ADVANCESHIPNOTICEDATA']._serialized_end=5375
+  _globals['_SHIPMENTDETAIL']._serialized_start=5378
+  _globals['_SHIPMENTDETAIL']._serialized_end=5569
+  _globals['_PACKAGEDIMENSIONS']._serialized_start=5571
+  _globals['_PACKAGEDIMENSIONS']._serialized_end=5662
+  _globals['_PACKAGEITEM']._serialized_start=5665
+  _globals['_PACKAGEITEM']._serialized_end=5795
+  _globals['_FUNCTIONALACKNOWLEDGMENTDATA']._serialized_start=5798
+  _globals['_FUNCTIONALACKNOWLEDGMENTDATA']._serialized_end=6182
+  _globals['_TRANSACTIONSETACKNOWLEDGMENT']._serialized_start=6185
+  _globals['_TRANSACTIONSETACKNOWLEDGMENT']._serialized_end=6320
+  _globals['_SEGMENTACKNOWLEDGMENT']._serialized_start=6322
+  _globals['_SEGMENTACKNOWLEDGMENT']._serialized_end=6436
+  _globals['_ELEMENTACKNOWLEDGMENT']._serialized_start=6438
+  _globals['_ELEMENTACKNOWLEDGMENT']._serialized_end=6547
+  _globals['_EDISERVICE']._serialized_start=6966
+  _globals['_EDISERVICE']._serialized_end=7429
 # @@protoc_insertion_point(module_scope)
@@ -3,7 +3,7 @@
 import grpc
 import warnings
 
-import edi_service_pb2 as edi__service__pb2
+from . import edi_service_pb2 as edi__service__pb2
 
 GRPC_GENERATED_VERSION = '1.75.1'
 GRPC_VERSION = grpc.__version__
@@ -62,6 +62,16 @@ class EdiServiceStub(object):
                 request_serializer=edi__service__pb2.ValidateEdiMessageRequest.SerializeToString,
                 response_deserializer=edi__service__pb2.ValidateEdiMessageResponse.FromString,
                 _registered_method=True)
+        self.ProcessEdiMessageBatch = channel.unary_unary(
+                '/edi.EdiService/ProcessEdiMessageBatch',
+                request_serializer=edi__service__pb2.ProcessEdiMessageBatchRequest.SerializeToString,
+                response_deserializer=edi__service__pb2.ProcessEdiMessageBatchResponse.FromString,
+                _registered_method=True)
+        self.ProcessEdiMessageStream = channel.stream_unary(
+                '/edi.EdiService/ProcessEdiMessageStream',
+                request_serializer=edi__service__pb2.EdiChunk.SerializeToString,
+                response_deserializer=edi__service__pb2.ProcessEdiMessageResponse.FromString,
+                _registered_method=True)
 
 
 class EdiServiceServicer(object):
@@ -101,6 +111,20 @@ class EdiServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def ProcessEdiMessageBatch(self, request, context):
+        """Process multiple EDI messages in a single call
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def ProcessEdiMessageStream(self, request_iterator, context):
+        """Process a large EDI message sent as a stream of chunks
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_EdiServiceServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -119,6 +143,16 @@ def add_EdiServiceServicer_to_server(servicer, server):
                     request_deserializer=edi__service__pb2.ValidateEdiMessageRequest.FromString,
                     response_serializer=edi__service__pb2.ValidateEdiMessageResponse.SerializeToString,
             ),
+            'ProcessEdiMessageBatch': grpc.unary_unary_rpc_method_handler(
+                    servicer.ProcessEdiMessageBatch,
+                    request_deserializer=edi__service__pb2.ProcessEdiMessageBatchRequest.FromString,
+                    response_serializer=edi__service__pb2.ProcessEdiMessageBatchResponse.SerializeToString,
+            ),
+            'ProcessEdiMessageStream': grpc.stream_unary_rpc_method_handler(
+                    servicer.ProcessEdiMessageStream,
+                    request_deserializer=edi__service__pb2.EdiChunk.FromString,
+                    response_serializer=edi__service__pb2.ProcessEdiMessageResponse.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'edi.EdiService', rpc_method_handlers)
@@ -223,3 +257,57 @@ class EdiService(object):
             timeout,
             metadata,
             _registered_method=True)
+
+    @staticmethod
+    def ProcessEdiMessageBatch(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/edi.EdiService/ProcessEdiMessageBatch',
+            edi__service__pb2.ProcessEdiMessageBatchRequest.SerializeToString,
+            edi__service__pb2.ProcessEdiMessageBatchResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def ProcessEdiMessageStream(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_unary(
+            request_iterator,
+            target,
+            '/edi.EdiService/ProcessEdiMessageStream',
+            edi__service__pb2.EdiChunk.SerializeToString,
+            edi__service__pb2.ProcessEdiMessageResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
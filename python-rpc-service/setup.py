@@ -40,6 +40,9 @@ setup(
             "flake8>=5.0.0",
             "mypy>=1.0.0",
         ],
+        "uvloop": [
+            "uvloop>=0.17.0",
+        ],
     },
     entry_points={
         "console_scripts": [
@@ -5,325 +5,509 @@ This module handles parsing of EDI messages into structured data.
 """
 
 import re
+import sys
 import logging
-from typing import Dict, List, Optional, Any, Tuple
-from dataclasses import dataclass
+from typing import Callable, Dict, FrozenSet, List, Optional, Any, Sequence, Tuple
+from dataclasses import dataclass, field
+from functools import partial
 from datetime import datetime
 
 from generated import edi_service_pb2
-from src.utils import setup_logging
+from src.utils import setup_logging, log_exception
 
 logger = setup_logging(__name__)
 
+_intern = sys.intern
+
+# Required/optional segments per message type, shared by all parser instances
+_SEGMENT_PATTERNS: Dict[str, Dict[str, FrozenSet[str]]] = {
+    "850": {
+        "required": frozenset({"ISA", "GS", "ST", "BEG", "SE", "GE", "IEA"}),
+        "optional": frozenset({"REF", "N1", "N3", "N4", "PO1", "CTT"})
+    },
+    "810": {
+        "required": frozenset({"ISA", "GS", "ST", "BIG", "SE", "GE", "IEA"}),
+        "optional": frozenset({"REF", "N1", "N3", "N4", "IT1", "TDS", "CTT"})
+    },
+    "856": {
+        "required": frozenset({"ISA", "GS", "ST", "BSN", "SE", "GE", "IEA"}),
+        "optional": frozenset({"REF", "N1", "N3", "N4", "HL", "PRF", "TD1", "TD5"})
+    },
+    "997": {
+        "required": frozenset({"ISA", "GS", "ST", "AK1", "SE", "GE", "IEA"}),
+        "optional": frozenset({"AK2", "AK5", "AK9"})
+    }
+}
+
+# N1 entity identifier code -> party field, per message type
+_N1_ROUTE_850 = {
+    "BY": "buyer",      # Buyer
+    "SE": "seller",     # Seller
+    "ST": "ship_to",    # Ship To
+    "BT": "bill_to",    # Bill To
+}
+_N1_ROUTE_810 = {
+    "BT": "bill_to",    # Bill To
+    "RE": "remit_to",   # Remit To
+    "SF": "ship_from",  # Ship From
+    "ST": "ship_to",    # Ship To
+}
+_N1_ROUTE_856 = {
+    "SF": "ship_from",  # Ship From
+    "ST": "ship_to",    # Ship To
+    "BT": "bill_to",    # Bill To
+    "CA": "carrier",    # Carrier
+}
+
+
+def split_lines(text: str) -> List[str]:
+    """
+    Split text into lines on "\n", "\r\n" or a bare "\r".
+    
+    Shared by the parser and the validator so both see the same lines and
+    line numbers. Unlike str.splitlines, no other Unicode line boundaries
+    (such as \x1c-\x1e, which EDI may use as separators) break a line.
+    """
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text.split('\n')
+
+
+@dataclass
+class Segments:
+    """EDI segments stored as parallel columns, one entry per segment."""
+    segment_ids: List[str] = field(default_factory=list)
+    elements: List[List[str]] = field(default_factory=list)
+    line_numbers: List[int] = field(default_factory=list)
+    
+    def __len__(self) -> int:
+        return len(self.segment_ids)
+
 
 @dataclass
 class ParseResult:
     """Result of EDI message parsing."""
     success: bool
     data: Optional[Any] = None
-    segments: List[edi_service_pb2.EdiSegment] = None
+    segments: Sequence[edi_service_pb2.EdiSegment] = None
     error_message: Optional[str] = None
 
 
+def _to_float(value: str) -> float:
+    """Convert a numeric EDI element to float, treating empty or malformed values as 0.0."""
+    if not value:
+        return 0.0
+    try:
+        return float(value)
+    except ValueError:
+        return 0.0
+
+
+def _parsing_error(error: Exception) -> ParseResult:
+    """Build the ParseResult for a message that failed to parse."""
+    return ParseResult(
+        success=False,
+        error_message=f"Parsing error: {str(error)}"
+    )
+
+
 class EdiParser:
     """Parser for EDI messages."""
     
     def __init__(self):
         """Initialize the EDI parser."""
-        self.segment_patterns = {
-            "850": {
-                "required": ["ISA", "GS", "ST", "BEG", "SE", "GE", "IEA"],
-                "optional": ["REF", "N1", "N3", "N4", "PO1", "CTT"]
-            },
-            "810": {
-                "required": ["ISA", "GS", "ST", "BIG", "SE", "GE", "IEA"],
-                "optional": ["REF", "N1", "N3", "N4", "IT1", "TDS", "CTT"]
-            },
-            "856": {
-                "required": ["ISA", "GS", "ST", "BSN", "SE", "GE", "IEA"],
-                "optional": ["REF", "N1", "N3", "N4", "HL", "PRF", "TD1", "TD5"]
-            },
-            "997": {
-                "required": ["ISA", "GS", "ST", "AK1", "SE", "GE", "IEA"],
-                "optional": ["AK2", "AK5", "AK9"]
-            }
+        self.segment_patterns = _SEGMENT_PATTERNS
+        
+        # Segment handlers per message type, keyed by segment ID
+        self._handlers_850 = {
+            "BEG": self._handle_beg,
+            "PO1": self._handle_po1,
+            "N1": partial(self._handle_n1, route=_N1_ROUTE_850),
+        }
+        self._handlers_810 = {
+            "BIG": self._handle_big,
+            "IT1": self._handle_it1,
+            "N1": partial(self._handle_n1, route=_N1_ROUTE_810),
+        }
+        # HL (Hierarchical Level) would be used to parse shipment details
+        self._handlers_856 = {
+            "BSN": self._handle_bsn,
+            "N1": partial(self._handle_n1, route=_N1_ROUTE_856),
+        }
+        self._handlers_997 = {
+            "AK1": self._handle_ak1,
+            "AK2": self._handle_ak2,
+            "AK5": self._handle_ak5,
+        }
+        
+        self._message_parsers = {
+            "850": self._parse_purchase_order,
+            "810": self._parse_invoice,
+            "856": self._parse_advance_ship_notice,
+            "997": self._parse_functional_acknowledgment,
         }
     
-    def parse_message(self, edi_message: str, message_type: str) -> ParseResult:
+    def parse_message(self, edi_message: str, message_type: str, data: Optional[Any] = None,
+                      segments_parent: Optional[Any] = None, include_segments: bool = True) -> ParseResult:
         """
         Parse an EDI message into structured data.
         
         Args:
             edi_message: Raw EDI message content
             message_type: EDI message type (850, 810, 856, 997)
+            data: Optional message of the type's data class to parse into in place,
+                such as a field of the response being built; created when omitted
+            segments_parent: Optional protobuf message, such as the response being
+                built, whose ``parsed_segments`` field receives the segments
+            include_segments: Whether to build protobuf segments at all; when False
+                ``ParseResult.segments`` is empty
             
         Returns:
             ParseResult containing parsed data or error information
         """
-        try:
-            logger.debug(f"Parsing EDI message of type {message_type}")
+        logger.debug("Parsing EDI message of type %s", message_type)
+        
+        parse_segments = self._message_parsers.get(message_type)
+        if parse_segments is None:
+            return ParseResult(
+                success=False,
+                error_message=f"Unsupported message type: {message_type}"
+            )
+        
+        return self._parse_with(parse_segments, edi_message, data, segments_parent, include_segments)
+    
+    def parse_messages(self, edi_messages: List[str], message_type: str) -> List[ParseResult]:
+        """
+        Parse a batch of EDI messages of the same type.
+        
+        The message type is resolved once for the whole batch, and a failure
+        in one message does not affect the others.
+        
+        Args:
+            edi_messages: Raw EDI message contents
+            message_type: EDI message type shared by every message in the batch
+            
+        Returns:
+            List of ParseResult, one per input message and in the same order
+        """
+        logger.debug("Parsing batch of %s EDI messages of type %s", len(edi_messages), message_type)
+        
+        parse_segments = self._message_parsers.get(message_type)
+        if parse_segments is None:
+            error_message = f"Unsupported message type: {message_type}"
+            return [ParseResult(success=False, error_message=error_message) for _ in edi_messages]
+        
+        parse_with = self._parse_with
+        return [parse_with(parse_segments, edi_message) for edi_message in edi_messages]
+    
+    def create_stream_parser(self, message_type: str) -> "EdiStreamParser":
+        """
+        Create a parser for a message that arrives in chunks.
+        
+        Args:
+            message_type: EDI message type (850, 810, 856, 997)
             
+        Returns:
+            EdiStreamParser that is fed chunks and parses the message on finish()
+        """
+        return EdiStreamParser(self, message_type)
+    
+    def _parse_with(self, parse_segments: Callable[[Segments, Optional[Any]], Any], edi_message: str, data: Optional[Any] = None,
+                    segments_parent: Optional[Any] = None, include_segments: bool = True) -> ParseResult:
+        """Split a message and parse its segments with the given message-type parser."""
+        try:
             # Split message into segments
             segments = self._split_into_segments(edi_message)
             
-            # Parse segments into structured data
-            if message_type == "850":
-                data = self._parse_purchase_order(segments)
-            elif message_type == "810":
-                data = self._parse_invoice(segments)
-            elif message_type == "856":
-                data = self._parse_advance_ship_notice(segments)
-            elif message_type == "997":
-                data = self._parse_functional_acknowledgment(segments)
-            else:
-                return ParseResult(
-                    success=False,
-                    error_message=f"Unsupported message type: {message_type}"
-                )
-            
-            # Convert segments to protobuf format
-            pb_segments = self._convert_segments_to_pb(segments)
-            
-            return ParseResult(
-                success=True,
-                data=data,
-                segments=pb_segments
-            )
+            return self._build_result(parse_segments, segments, data, segments_parent, include_segments)
             
         except Exception as e:
-            logger.error(f"Error parsing EDI message: {str(e)}", exc_info=True)
-            return ParseResult(
-                success=False,
-                error_message=f"Parsing error: {str(e)}"
-            )
+            log_exception(logger, "Error parsing EDI message: %s", e)
+            return _parsing_error(e)
     
-    def _split_into_segments(self, edi_message: str) -> List[Dict[str, Any]]:
-        """Split EDI message into segments."""
-        segments = []
-        lines = edi_message.strip().split('\n')
+    def _build_result(self, parse_segments: Callable[[Segments, Optional[Any]], Any], segments: Segments, data: Optional[Any] = None,
+                      segments_parent: Optional[Any] = None, include_segments: bool = True) -> ParseResult:
+        """Parse split segments with the given message-type parser."""
+        # Parse segments into structured data
+        data = parse_segments(segments, data)
         
-        for i, line in enumerate(lines):
-            line = line.strip()
-            if not line:
-                continue
-                
-            # Split segment into elements
-            elements = line.split('*')
-            if len(elements) < 2:
-                continue
-                
-            segment_id = elements[0]
-            segment_data = {
-                'segment_id': segment_id,
-                'elements': elements[1:],
-                'line_number': i + 1,
-                'position': len(segments) + 1
-            }
-            segments.append(segment_data)
+        # Convert segments to protobuf format, straight into the caller's message
+        # when one is given so they never need copying
+        if not include_segments:
+            pb_segments = ()
+        else:
+            if segments_parent is None:
+                segments_parent = edi_service_pb2.ProcessEdiMessageResponse()
+            pb_segments = self._convert_segments_to_pb(segments, segments_parent)
         
-        return segments
+        return ParseResult(
+            success=True,
+            data=data,
+            segments=pb_segments
+        )
     
-    def _convert_segments_to_pb(self, segments: List[Dict[str, Any]]) -> List[edi_service_pb2.EdiSegment]:
-        """Convert segments to protobuf format."""
-        pb_segments = []
-        for segment in segments:
-            pb_segment = edi_service_pb2.EdiSegment(
-                segment_id=segment['segment_id'],
-                elements=segment['elements'],
-                line_number=segment['line_number'],
-                position=segment['position']
-            )
-            pb_segments.append(pb_segment)
-        return pb_segments
+    def _split_into_segments(self, edi_message: str) -> Segments:
+        """Split EDI message into segments."""
+        segments = Segments()
+        self._split_lines(edi_message, 1, segments)
+        return segments
     
-    def _parse_purchase_order(self, segments: List[Dict[str, Any]]) -> edi_service_pb2.PurchaseOrderData:
-        """Parse EDI 850 Purchase Order."""
-        po_data = edi_service_pb2.PurchaseOrderData()
+    def _split_lines(self, text: str, first_line_number: int, segments: Segments) -> int:
+        """
+        Split complete segments out of text, appending them to segments.
         
-        for segment in segments:
-            segment_id = segment['segment_id']
-            elements = segment['elements']
-            
-            if segment_id == "BEG":
-                # Purchase Order Beginning Segment
-                if len(elements) >= 2:
-                    po_data.po_number = elements[1] if len(elements) > 1 else ""
-                if len(elements) >= 3:
-                    po_data.po_date = elements[2] if len(elements) > 2 else ""
-                    
-            elif segment_id == "PO1":
-                # Purchase Order Line Item
-                line_item = edi_service_pb2.PurchaseOrderLineItem()
-                if len(elements) >= 1:
-                    line_item.line_number = elements[0]
-                if len(elements) >= 2:
-                    line_item.quantity_ordered.value = float(elements[1]) if elements[1] else 0.0
-                if len(elements) >= 3:
-                    line_item.quantity_ordered.unit_of_measure = elements[2]
-                if len(elements) >= 4:
-                    line_item.unit_price.value = float(elements[3]) if elements[3] else 0.0
-                if len(elements) >= 5:
-                    line_item.product.description = elements[4]
-                if len(elements) >= 6:
-                    line_item.product.product_id = elements[5]
+        Returns:
+            Number of line breaks in text
+        """
+        segment_ids = segments.segment_ids
+        elements_list = segments.elements
+        line_numbers = segments.line_numbers
+        
+        # Segments are terminated by "~" and/or line breaks; str.split is a
+        # C-level scan and measurably faster than an equivalent re.split, or
+        # than a bytes regex scan (which would also need every element that
+        # reaches a protobuf string field decoded back to str)
+        lines = split_lines(text)
+        for line_number, line in enumerate(lines, first_line_number):
+            for raw_segment in line.split('~'):
+                raw_segment = raw_segment.strip()
+                if not raw_segment:
+                    continue
                 
-                po_data.line_items.append(line_item)
+                # Peel off the segment ID, then split the remaining elements;
+                # this avoids slicing a copy of the full element list
+                segment_id, separator, raw_elements = raw_segment.partition('*')
+                if not separator:
+                    continue
                 
-            elif segment_id == "N1":
-                # Name/Address Segment
-                if len(elements) >= 2:
-                    entity_code = elements[0]
-                    name = elements[1]
-                    
-                    party = edi_service_pb2.Party(
-                        entity_identifier_code=entity_code,
-                        name=name
-                    )
-                    
-                    if entity_code == "BY":  # Buyer
-                        po_data.buyer.CopyFrom(party)
-                    elif entity_code == "SE":  # Seller
-                        po_data.seller.CopyFrom(party)
-                    elif entity_code == "ST":  # Ship To
-                        po_data.ship_to.CopyFrom(party)
-                    elif entity_code == "BT":  # Bill To
-                        po_data.bill_to.CopyFrom(party)
+                # Segment IDs come from a small fixed vocabulary; interning them
+                # shares one string object per ID and makes dispatch lookups
+                # succeed on the identity check
+                segment_ids.append(_intern(segment_id))
+                elements_list.append(raw_elements.split('*'))
+                line_numbers.append(line_number)
         
-        return po_data
+        return len(lines) - 1
     
-    def _parse_invoice(self, segments: List[Dict[str, Any]]) -> edi_service_pb2.InvoiceData:
-        """Parse EDI 810 Invoice."""
-        invoice_data = edi_service_pb2.InvoiceData()
+    def _convert_segments_to_pb(self, segments: Segments, parent_pb: Any) -> Sequence[edi_service_pb2.EdiSegment]:
+        """
+        Convert segments to protobuf format.
         
-        for segment in segments:
-            segment_id = segment['segment_id']
-            elements = segment['elements']
-            
-            if segment_id == "BIG":
-                # Invoice Beginning Segment
-                if len(elements) >= 1:
-                    invoice_data.invoice_date = elements[0]
-                if len(elements) >= 2:
-                    invoice_data.invoice_number = elements[1]
-                if len(elements) >= 3:
-                    invoice_data.due_date = elements[2]
-                    
-            elif segment_id == "IT1":
-                # Invoice Line Item
-                line_item = edi_service_pb2.InvoiceLineItem()
-                if len(elements) >= 1:
-                    line_item.line_number = elements[0]
-                if len(elements) >= 2:
-                    line_item.quantity_invoiced.value = float(elements[1]) if elements[1] else 0.0
-                if len(elements) >= 3:
-                    line_item.quantity_invoiced.unit_of_measure = elements[2]
-                if len(elements) >= 4:
-                    line_item.unit_price.value = float(elements[3]) if elements[3] else 0.0
-                if len(elements) >= 5:
-                    line_item.product.description = elements[4]
-                if len(elements) >= 6:
-                    line_item.product.product_id = elements[5]
-                
-                invoice_data.line_items.append(line_item)
-                
-            elif segment_id == "N1":
-                # Name/Address Segment
-                if len(elements) >= 2:
-                    entity_code = elements[0]
-                    name = elements[1]
-                    
-                    party = edi_service_pb2.Party(
-                        entity_identifier_code=entity_code,
-                        name=name
-                    )
-                    
-                    if entity_code == "BT":  # Bill To
-                        invoice_data.bill_to.CopyFrom(party)
-                    elif entity_code == "RE":  # Remit To
-                        invoice_data.remit_to.CopyFrom(party)
-                    elif entity_code == "SF":  # Ship From
-                        invoice_data.ship_from.CopyFrom(party)
-                    elif entity_code == "ST":  # Ship To
-                        invoice_data.ship_to.CopyFrom(party)
+        Segments are added in place to ``parent_pb.parsed_segments``, which
+        avoids building standalone EdiSegment messages that would have to be
+        copied into the parent afterwards.
         
-        return invoice_data
+        Args:
+            segments: Segments to convert
+            parent_pb: Protobuf message with a repeated ``parsed_segments`` field
+            
+        Returns:
+            The parent's ``parsed_segments`` repeated field
+        """
+        parsed_segments = parent_pb.parsed_segments
+        add = parsed_segments.add
+        columns = zip(segments.segment_ids, segments.elements, segments.line_numbers)
+        for position, (segment_id, elements, line_number) in enumerate(columns, 1):
+            pb_segment = add()
+            pb_segment.segment_id = segment_id
+            pb_segment.elements.extend(elements)
+            pb_segment.line_number = line_number
+            pb_segment.position = position
+        return parsed_segments
+    
+    def _apply_handlers(self, segments: Segments, handlers: Dict[str, Callable[[List[str], Any], None]], data: Any) -> Any:
+        """Run the handler registered for each segment ID against the message data."""
+        for segment_id, elements in zip(segments.segment_ids, segments.elements):
+            handler = handlers.get(segment_id)
+            if handler:
+                handler(elements, data)
+        return data
+    
+    def _parse_purchase_order(self, segments: Segments, po_data: Optional[edi_service_pb2.PurchaseOrderData] = None) -> edi_service_pb2.PurchaseOrderData:
+        """Parse EDI 850 Purchase Order."""
+        if po_data is None:
+            po_data = edi_service_pb2.PurchaseOrderData()
+        return self._apply_handlers(segments, self._handlers_850, po_data)
     
-    def _parse_advance_ship_notice(self, segments: List[Dict[str, Any]]) -> edi_service_pb2.AdvanceShipNoticeData:
+    def _parse_invoice(self, segments: Segments, invoice_data: Optional[edi_service_pb2.InvoiceData] = None) -> edi_service_pb2.InvoiceData:
+        """Parse EDI 810 Invoice."""
+        if invoice_data is None:
+            invoice_data = edi_service_pb2.InvoiceData()
+        return self._apply_handlers(segments, self._handlers_810, invoice_data)
+    
+    def _parse_advance_ship_notice(self, segments: Segments, asn_data: Optional[edi_service_pb2.AdvanceShipNoticeData] = None) -> edi_service_pb2.AdvanceShipNoticeData:
         """Parse EDI 856 Advance Ship Notice."""
-        asn_data = edi_service_pb2.AdvanceShipNoticeData()
-        
-        for segment in segments:
-            segment_id = segment['segment_id']
-            elements = segment['elements']
+        if asn_data is None:
+            asn_data = edi_service_pb2.AdvanceShipNoticeData()
+        return self._apply_handlers(segments, self._handlers_856, asn_data)
+    
+    def _parse_functional_acknowledgment(self, segments: Segments, fa_data: Optional[edi_service_pb2.FunctionalAcknowledgmentData] = None) -> edi_service_pb2.FunctionalAcknowledgmentData:
+        """Parse EDI 997 Functional Acknowledgment."""
+        if fa_data is None:
+            fa_data = edi_service_pb2.FunctionalAcknowledgmentData()
+        return self._apply_handlers(segments, self._handlers_997, fa_data)
+    
+    def _handle_beg(self, elements: List[str], po_data: edi_service_pb2.PurchaseOrderData) -> None:
+        """Purchase Order Beginning Segment."""
+        if len(elements) >= 2:
+            po_data.po_number = elements[1] if len(elements) > 1 else ""
+        if len(elements) >= 3:
+            po_data.po_date = elements[2] if len(elements) > 2 else ""
+    
+    def _handle_po1(self, elements: List[str], po_data: edi_service_pb2.PurchaseOrderData) -> None:
+        """Purchase Order Line Item."""
+        # Build the entry in place; appending a standalone message copies it
+        line_item = po_data.line_items.add()
+        element_count = len(elements)
+        if element_count >= 1:
+            line_item.line_number = elements[0]
+        if element_count >= 2:
+            quantity = line_item.quantity_ordered
+            quantity.value = _to_float(elements[1])
+            if element_count >= 3:
+                quantity.unit_of_measure = elements[2]
+        if element_count >= 4:
+            line_item.unit_price.value = _to_float(elements[3])
+        if element_count >= 5:
+            product = line_item.product
+            product.description = elements[4]
+            if element_count >= 6:
+                product.product_id = elements[5]
+    
+    def _handle_n1(self, elements: List[str], data: Any, route: Dict[str, str]) -> None:
+        """Name/Address Segment, routed to a party field by entity identifier code."""
+        if len(elements) >= 2:
+            entity_code = elements[0]
+            field_name = route.get(entity_code)
+            if field_name is None:
+                return
             
-            if segment_id == "BSN":
-                # Ship Notice Beginning Segment
-                if len(elements) >= 1:
-                    asn_data.shipment_id = elements[0]
-                if len(elements) >= 2:
-                    asn_data.shipment_date = elements[1]
-                if len(elements) >= 3:
-                    asn_data.expected_delivery_date = elements[2]
-                    
-            elif segment_id == "HL":
-                # Hierarchical Level
-                # This would be used to parse shipment details
-                pass
-                
-            elif segment_id == "N1":
-                # Name/Address Segment
-                if len(elements) >= 2:
-                    entity_code = elements[0]
-                    name = elements[1]
-                    
-                    party = edi_service_pb2.Party(
-                        entity_identifier_code=entity_code,
-                        name=name
-                    )
-                    
-                    if entity_code == "SF":  # Ship From
-                        asn_data.ship_from.CopyFrom(party)
-                    elif entity_code == "ST":  # Ship To
-                        asn_data.ship_to.CopyFrom(party)
-                    elif entity_code == "BT":  # Bill To
-                        asn_data.bill_to.CopyFrom(party)
-                    elif entity_code == "CA":  # Carrier
-                        asn_data.carrier.CopyFrom(party)
+            party = getattr(data, field_name)
+            party.Clear()
+            party.entity_identifier_code = entity_code
+            party.name = elements[1]
+    
+    def _handle_big(self, elements: List[str], invoice_data: edi_service_pb2.InvoiceData) -> None:
+        """Invoice Beginning Segment."""
+        if len(elements) >= 1:
+            invoice_data.invoice_date = elements[0]
+        if len(elements) >= 2:
+            invoice_data.invoice_number = elements[1]
+        if len(elements) >= 3:
+            invoice_data.due_date = elements[2]
+    
+    def _handle_it1(self, elements: List[str], invoice_data: edi_service_pb2.InvoiceData) -> None:
+        """Invoice Line Item."""
+        line_item = invoice_data.line_items.add()
+        element_count = len(elements)
+        if element_count >= 1:
+            line_item.line_number = elements[0]
+        if element_count >= 2:
+            quantity = line_item.quantity_invoiced
+            quantity.value = _to_float(elements[1])
+            if element_count >= 3:
+                quantity.unit_of_measure = elements[2]
+        if element_count >= 4:
+            line_item.unit_price.value = _to_float(elements[3])
+        if element_count >= 5:
+            product = line_item.product
+            product.description = elements[4]
+            if element_count >= 6:
+                product.product_id = elements[5]
+    
+    def _handle_bsn(self, elements: List[str], asn_data: edi_service_pb2.AdvanceShipNoticeData) -> None:
+        """Ship Notice Beginning Segment."""
+        if len(elements) >= 1:
+            asn_data.shipment_id = elements[0]
+        if len(elements) >= 2:
+            asn_data.shipment_date = elements[1]
+        if len(elements) >= 3:
+            asn_data.expected_delivery_date = elements[2]
+    
+    def _handle_ak1(self, elements: List[str], fa_data: edi_service_pb2.FunctionalAcknowledgmentData) -> None:
+        """Functional Group Response Header."""
+        if len(elements) >= 1:
+            fa_data.original_transaction_set_id = elements[0]
+        if len(elements) >= 2:
+            fa_data.original_control_number = elements[1]
+        if len(elements) >= 3:
+            fa_data.acknowledgment_code = elements[2]
+    
+    def _handle_ak2(self, elements: List[str], fa_data: edi_service_pb2.FunctionalAcknowledgmentData) -> None:
+        """Transaction Set Response Header."""
+        transaction_ack = fa_data.transaction_set_acks.add()
+        if len(elements) >= 1:
+            transaction_ack.transaction_set_id = elements[0]
+        if len(elements) >= 2:
+            transaction_ack.control_number = elements[1]
+        if len(elements) >= 3:
+            transaction_ack.acknowledgment_code = elements[2]
+    
+    def _handle_ak5(self, elements: List[str], fa_data: edi_service_pb2.FunctionalAcknowledgmentData) -> None:
+        """Transaction Set Response Trailer."""
+        if len(elements) >= 1:
+            fa_data.acknowledgment_code = elements[0]
+
+
+class EdiStreamParser:
+    """
+    Incremental parser for an EDI message delivered in chunks.
+    
+    Complete segments are split out as each chunk arrives, so only the
+    trailing partial segment is buffered; the message-type handlers run once
+    the last chunk has been fed.
+    """
+    
+    def __init__(self, parser: EdiParser, message_type: str):
+        """Initialize the stream parser for one message."""
+        self._parser = parser
+        self._message_type = message_type
+        self._segments = Segments()
+        self._pending: List[str] = []
+        self._line_number = 1
+    
+    def feed(self, chunk: str) -> None:
+        """Split every segment completed by this chunk."""
+        # Buffered parts hold no terminator, so only the new chunk needs
+        # searching; parts are joined once a terminator arrives, which keeps
+        # a long run of unterminated chunks linear rather than quadratic
+        cut = max(chunk.rfind('~'), chunk.rfind('\n')) + 1
+        if not cut:
+            if chunk:
+                self._pending.append(chunk)
+            return
         
-        return asn_data
+        pending = self._pending
+        pending.append(chunk[:cut])
+        complete = ''.join(pending)
+        self._pending = [chunk[cut:]] if cut < len(chunk) else []
+        # The cut never falls between "\r" and "\n", so line breaks are
+        # counted the same as for the whole message
+        self._line_number += self._parser._split_lines(complete, self._line_number, self._segments)
     
-    def _parse_functional_acknowledgment(self, segments: List[Dict[str, Any]]) -> edi_service_pb2.FunctionalAcknowledgmentData:
-        """Parse EDI 997 Functional Acknowledgment."""
-        fa_data = edi_service_pb2.FunctionalAcknowledgmentData()
+    def finish(self, data: Optional[Any] = None, segments_parent: Optional[Any] = None, include_segments: bool = True) -> ParseResult:
+        """
+        Flush any unterminated final segment and parse the message.
         
-        for segment in segments:
-            segment_id = segment['segment_id']
-            elements = segment['elements']
-            
-            if segment_id == "AK1":
-                # Functional Group Response Header
-                if len(elements) >= 1:
-                    fa_data.original_transaction_set_id = elements[0]
-                if len(elements) >= 2:
-                    fa_data.original_control_number = elements[1]
-                if len(elements) >= 3:
-                    fa_data.acknowledgment_code = elements[2]
-                    
-            elif segment_id == "AK2":
-                # Transaction Set Response Header
-                transaction_ack = edi_service_pb2.TransactionSetAcknowledgment()
-                if len(elements) >= 1:
-                    transaction_ack.transaction_set_id = elements[0]
-                if len(elements) >= 2:
-                    transaction_ack.control_number = elements[1]
-                if len(elements) >= 3:
-                    transaction_ack.acknowledgment_code = elements[2]
-                
-                fa_data.transaction_set_acks.append(transaction_ack)
-                
-            elif segment_id == "AK5":
-                # Transaction Set Response Trailer
-                if len(elements) >= 1:
-                    fa_data.acknowledgment_code = elements[0]
+        Args:
+            data, segments_parent, include_segments: As for EdiParser.parse_message
+        """
+        logger.debug("Parsing streamed EDI message of type %s", self._message_type)
+        
+        parse_segments = self._parser._message_parsers.get(self._message_type)
+        if parse_segments is None:
+            return ParseResult(
+                success=False,
+                error_message=f"Unsupported message type: {self._message_type}"
+            )
         
-        return fa_data
+        try:
+            if self._pending:
+                self._parser._split_lines(''.join(self._pending), self._line_number, self._segments)
+                self._pending = []
+            
+            return self._parser._build_result(parse_segments, self._segments, data, segments_parent, include_segments)
+            
+        except Exception as e:
+            log_exception(logger, "Error parsing streamed EDI message: %s", e)
+            return _parsing_error(e)
@@ -5,68 +5,216 @@ This module implements the gRPC EDI service with business logic for processing
 EDI messages of various types (850, 810, 856, 997).
 """
 
+import asyncio
 import grpc
 import logging
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from functools import partial
+from typing import AsyncIterator, Callable, Dict, List, Optional, Any, Sequence, Tuple, TypeVar
 from concurrent import futures
 
+from google.protobuf.internal import api_implementation
+
 from generated import edi_service_pb2
 from generated import edi_service_pb2_grpc
-from src.edi_parser import EdiParser
+from src.edi_parser import EdiParser, EdiStreamParser
 from src.edi_validator import EdiValidator
-from src.utils import setup_logging
+from src.utils import MAX_MESSAGE_LENGTH, setup_logging, get_env_int, get_env_str, log_exception
 
 logger = setup_logging(__name__)
 
+# Largest EDI payload accepted for parsing or validation, unary or streamed,
+# in UTF-8 bytes
+MAX_EDI_MESSAGE_BYTES = 8 * 1024 * 1024
+
+# Stream chunks at least this long are split into segments in the executor;
+# smaller ones are cheaper to split inline than to hand off to a thread
+STREAM_FEED_EXECUTOR_THRESHOLD = 64 * 1024
+
+
+def _utf8_length(text: str) -> int:
+    """Return the UTF-8 encoded size of text in bytes."""
+    # str.isascii is O(1) in CPython, so typical ASCII EDI never pays for an encode
+    if text.isascii():
+        return len(text)
+    return len(text.encode('utf-8'))
+
+
+def _build_supported_types() -> Tuple[edi_service_pb2.EdiMessageType, ...]:
+    """Build the supported EDI message types."""
+    return (
+        edi_service_pb2.EdiMessageType(
+            code="850",
+            name="Purchase Order",
+            description="EDI 850 Purchase Order transaction set",
+            supported=True,
+            required_segments=["ISA", "GS", "ST", "BEG", "SE", "GE", "IEA"],
+            optional_segments=["REF", "N1", "N3", "N4", "PO1", "CTT"]
+        ),
+        edi_service_pb2.EdiMessageType(
+            code="810",
+            name="Invoice",
+            description="EDI 810 Invoice transaction set",
+            supported=True,
+            required_segments=["ISA", "GS", "ST", "BIG", "SE", "GE", "IEA"],
+            optional_segments=["REF", "N1", "N3", "N4", "IT1", "TDS", "CTT"]
+        ),
+        edi_service_pb2.EdiMessageType(
+            code="856",
+            name="Advance Ship Notice",
+            description="EDI 856 Advance Ship Notice transaction set",
+            supported=True,
+            required_segments=["ISA", "GS", "ST", "BSN", "SE", "GE", "IEA"],
+            optional_segments=["REF", "N1", "N3", "N4", "HL", "PRF", "TD1", "TD5"]
+        ),
+        edi_service_pb2.EdiMessageType(
+            code="997",
+            name="Functional Acknowledgment",
+            description="EDI 997 Functional Acknowledgment transaction set",
+            supported=True,
+            required_segments=["ISA", "GS", "ST", "AK1", "SE", "GE", "IEA"],
+            optional_segments=["AK2", "AK5", "AK9"]
+        )
+    )
+
+
+def _check_protobuf_backend() -> None:
+    """Warn when protobuf is running on its pure-Python implementation."""
+    backend = api_implementation.Type()
+    if backend == "python":
+        # Message construction and serialization are orders of magnitude slower
+        logger.warning(
+            "protobuf is using the pure-Python implementation; set "
+            "PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION=upb for the native backend"
+        )
+    else:
+        logger.info("protobuf implementation: %s", backend)
+
+
+def _install_uvloop() -> None:
+    """Use uvloop's faster event loop when it is installed."""
+    try:
+        import uvloop
+    except ImportError:
+        logger.debug("uvloop not installed; using the default asyncio event loop")
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    logger.info("Using uvloop event loop")
+
+
+@dataclass(frozen=True)
+class ServerConfig:
+    """Server settings, read from the environment once at startup."""
+    __slots__ = (
+        "host", "port", "max_workers", "max_message_length", "max_edi_message_bytes",
+        "max_concurrent_streams", "http2_max_frame_size", "min_time_between_pings_ms",
+        "keepalive_time_ms", "keepalive_timeout_ms",
+    )
+    
+    host: str
+    port: int
+    max_workers: int
+    max_message_length: int
+    max_edi_message_bytes: int
+    max_concurrent_streams: int
+    http2_max_frame_size: int
+    min_time_between_pings_ms: int
+    keepalive_time_ms: int
+    keepalive_timeout_ms: int
+    
+    @classmethod
+    def from_env(cls) -> "ServerConfig":
+        """Build the configuration from EDI_* environment variables, with defaults."""
+        return cls(
+            host=get_env_str("EDI_SERVICE_HOST", "localhost"),
+            port=get_env_int("EDI_SERVICE_PORT", 50051),
+            max_workers=get_env_int("EDI_MAX_WORKERS", 10),
+            max_message_length=get_env_int("EDI_MAX_MESSAGE_LENGTH", MAX_MESSAGE_LENGTH),
+            max_edi_message_bytes=get_env_int("EDI_MAX_MESSAGE_BYTES", MAX_EDI_MESSAGE_BYTES),
+            max_concurrent_streams=get_env_int("EDI_MAX_CONCURRENT_STREAMS", 512),
+            http2_max_frame_size=get_env_int("EDI_HTTP2_MAX_FRAME_SIZE", 1024 * 1024),
+            min_time_between_pings_ms=get_env_int("EDI_MIN_TIME_BETWEEN_PINGS_MS", 10000),
+            keepalive_time_ms=get_env_int("EDI_KEEPALIVE_TIME_MS", 10000),
+            keepalive_timeout_ms=get_env_int("EDI_KEEPALIVE_TIMEOUT_MS", 20000),
+        )
+    
+    @property
+    def listen_addr(self) -> str:
+        """Address the server binds to."""
+        return f"{self.host}:{self.port}"
+    
+    def grpc_options(self) -> List[Tuple[str, int]]:
+        """Build the gRPC server channel options."""
+        return [
+            ("grpc.max_send_message_length", self.max_message_length),
+            ("grpc.max_receive_message_length", self.max_message_length),
+            ("grpc.max_concurrent_streams", self.max_concurrent_streams),
+            ("grpc.http2.max_frame_size", self.http2_max_frame_size),
+            ("grpc.http2.min_time_between_pings_ms", self.min_time_between_pings_ms),
+            ("grpc.keepalive_time_ms", self.keepalive_time_ms),
+            ("grpc.keepalive_timeout_ms", self.keepalive_timeout_ms),
+        ]
+
+
+# Supported message types are static reference data, built once per process
+_SUPPORTED_TYPES = _build_supported_types()
+
+_T = TypeVar("_T")
+
+
+def _error_response(response: _T, status: int, code: str, message: str, **fields: Any) -> _T:
+    """
+    Fill response with a status and a single error-level ProcessingMessage.
+    
+    The response is cleared first, so a partially parsed response (or a batch
+    slot) can be turned into an error in place. Returns the response.
+    """
+    response.Clear()
+    response.status = status
+    for name, value in fields.items():
+        setattr(response, name, value)
+    # Adding the entry in place skips building a standalone ProcessingMessage
+    # that the repeated field would then copy
+    response.messages.add(level=edi_service_pb2.MESSAGE_LEVEL_ERROR, code=code, message=message)
+    return response
+
 
 class EdiServiceServicer(edi_service_pb2_grpc.EdiServiceServicer):
     """Implementation of the EDI service."""
     
-    def __init__(self):
-        """Initialize the EDI service."""
+    def __init__(self, executor: Optional[futures.Executor] = None, max_edi_message_bytes: int = MAX_EDI_MESSAGE_BYTES):
+        """
+        Initialize the EDI service.
+        
+        Args:
+            executor: Executor for CPU-bound parsing and validation work;
+                the event loop's default executor is used when omitted
+            max_edi_message_bytes: Largest EDI payload accepted
+        """
+        self._executor = executor
+        self._max_edi_message_bytes = max_edi_message_bytes
         self.parser = EdiParser()
         self.validator = EdiValidator()
-        self.supported_types = self._initialize_supported_types()
+        self.supported_types = _SUPPORTED_TYPES
+        self._supported_codes = frozenset(msg_type.code for msg_type in self.supported_types)
         
-    def _initialize_supported_types(self) -> List[edi_service_pb2.EdiMessageType]:
-        """Initialize the list of supported EDI message types."""
-        return [
-            edi_service_pb2.EdiMessageType(
-                code="850",
-                name="Purchase Order",
-                description="EDI 850 Purchase Order transaction set",
-                supported=True,
-                required_segments=["ISA", "GS", "ST", "BEG", "SE", "GE", "IEA"],
-                optional_segments=["REF", "N1", "N3", "N4", "PO1", "CTT"]
-            ),
-            edi_service_pb2.EdiMessageType(
-                code="810",
-                name="Invoice",
-                description="EDI 810 Invoice transaction set",
-                supported=True,
-                required_segments=["ISA", "GS", "ST", "BIG", "SE", "GE", "IEA"],
-                optional_segments=["REF", "N1", "N3", "N4", "IT1", "TDS", "CTT"]
-            ),
-            edi_service_pb2.EdiMessageType(
-                code="856",
-                name="Advance Ship Notice",
-                description="EDI 856 Advance Ship Notice transaction set",
-                supported=True,
-                required_segments=["ISA", "GS", "ST", "BSN", "SE", "GE", "IEA"],
-                optional_segments=["REF", "N1", "N3", "N4", "HL", "PRF", "TD1", "TD5"]
-            ),
-            edi_service_pb2.EdiMessageType(
-                code="997",
-                name="Functional Acknowledgment",
-                description="EDI 997 Functional Acknowledgment transaction set",
-                supported=True,
-                required_segments=["ISA", "GS", "ST", "AK1", "SE", "GE", "IEA"],
-                optional_segments=["AK2", "AK5", "AK9"]
-            )
-        ]
-    
-    def ProcessEdiMessage(self, request: edi_service_pb2.ProcessEdiMessageRequest, context: grpc.ServicerContext) -> edi_service_pb2.ProcessEdiMessageResponse:
+        # The supported-types payload is static, so build its response once,
+        # and serialize it once for the handler that sends raw bytes
+        self._supported_types_response = edi_service_pb2.GetSupportedMessageTypesResponse(
+            supported_types=self.supported_types
+        )
+        self._supported_types_bytes = self._supported_types_response.SerializeToString()
+        
+        # Message type -> ProcessEdiMessageResponse parsed_data oneof field
+        self._parsed_data_fields = {
+            "850": "purchase_order",
+            "810": "invoice",
+            "856": "advance_ship_notice",
+            "997": "functional_acknowledgment",
+        }
+        
+    async def ProcessEdiMessage(self, request: edi_service_pb2.ProcessEdiMessageRequest, context: grpc.ServicerContext) -> edi_service_pb2.ProcessEdiMessageResponse:
         """
         Process any EDI message type.
         
@@ -77,113 +225,41 @@ class EdiServiceServicer(edi_service_pb2_grpc.EdiServiceServicer):
         Returns:
             ProcessEdiMessageResponse containing parsed data and processing status
         """
+        # One timestamp per request, shared by whichever response is returned
+        processed_at = datetime.now().isoformat()
+        message_type = request.message_type
+        
         try:
-            logger.info(f"Processing EDI message of type {request.message_type} for customer {request.customer_id}")
+            logger.info("Processing EDI message of type %s for customer %s", message_type, request.customer_id)
             
             # Validate message type is supported
-            if not self._is_message_type_supported(request.message_type):
+            if message_type not in self._supported_codes:
                 context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
-                context.set_details(f"Unsupported message type: {request.message_type}")
-                return edi_service_pb2.ProcessEdiMessageResponse(
-                    status=edi_service_pb2.PROCESSING_STATUS_UNSUPPORTED_MESSAGE_TYPE,
-                    message_type=request.message_type,
-                    processed_at=datetime.now().isoformat(),
-                    messages=[
-                        edi_service_pb2.ProcessingMessage(
-                            level=edi_service_pb2.MESSAGE_LEVEL_ERROR,
-                            code="UNSUPPORTED_MESSAGE_TYPE",
-                            message=f"Message type {request.message_type} is not supported"
-                        )
-                    ]
-                )
-            
-            # Validate EDI message format if requested
-            messages = []
-            if request.options and request.options.validate_format:
-                validation_result = self.validator.validate_format(request.edi_message, request.message_type)
-                if not validation_result.is_valid:
-                    messages.extend(validation_result.messages)
-                    if validation_result.has_errors:
-                        return edi_service_pb2.ProcessEdiMessageResponse(
-                            status=edi_service_pb2.PROCESSING_STATUS_VALIDATION_ERROR,
-                            message_type=request.message_type,
-                            processed_at=datetime.now().isoformat(),
-                            messages=messages
-                        )
-            
-            # Parse the EDI message
-            parse_result = self.parser.parse_message(request.edi_message, request.message_type)
+                context.set_details(f"Unsupported message type: {message_type}")
+                return self._unsupported_response(edi_service_pb2.ProcessEdiMessageResponse(), message_type, processed_at)
             
-            if not parse_result.success:
-                return edi_service_pb2.ProcessEdiMessageResponse(
-                    status=edi_service_pb2.PROCESSING_STATUS_PARSING_ERROR,
-                    message_type=request.message_type,
-                    processed_at=datetime.now().isoformat(),
-                    messages=[
-                        edi_service_pb2.ProcessingMessage(
-                            level=edi_service_pb2.MESSAGE_LEVEL_ERROR,
-                            code="PARSING_ERROR",
-                            message=parse_result.error_message
-                        )
-                    ]
+            # Reject oversized payloads before paying for a full parse
+            message_length = _utf8_length(request.edi_message)
+            if message_length > self._max_edi_message_bytes:
+                context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+                context.set_details("EDI message too large")
+                return self._too_large_response(
+                    edi_service_pb2.ProcessEdiMessageResponse(), message_length,
+                    message_type=message_type, processed_at=processed_at
                 )
             
-            # Validate business rules if requested
-            if request.options and request.options.validate_business_rules:
-                business_validation = self.validator.validate_business_rules(parse_result.data, request.message_type)
-                if not business_validation.is_valid:
-                    messages.extend(business_validation.messages)
-                    if business_validation.has_errors:
-                        return edi_service_pb2.ProcessEdiMessageResponse(
-                            status=edi_service_pb2.PROCESSING_STATUS_BUSINESS_RULE_ERROR,
-                            message_type=request.message_type,
-                            processed_at=datetime.now().isoformat(),
-                            messages=messages
-                        )
-            
-            # Create response with parsed data
-            response = edi_service_pb2.ProcessEdiMessageResponse(
-                status=edi_service_pb2.PROCESSING_STATUS_SUCCESS,
-                message_type=request.message_type,
-                processed_at=datetime.now().isoformat(),
-                messages=messages
+            # Validation and parsing are CPU-bound; keep them off the event loop
+            return await self._run_blocking(
+                self._process_supported_message, request, processed_at, edi_service_pb2.ProcessEdiMessageResponse()
             )
             
-            # Set the appropriate parsed data based on message type
-            if request.message_type == "850":
-                response.purchase_order.CopyFrom(parse_result.data)
-            elif request.message_type == "810":
-                response.invoice.CopyFrom(parse_result.data)
-            elif request.message_type == "856":
-                response.advance_ship_notice.CopyFrom(parse_result.data)
-            elif request.message_type == "997":
-                response.functional_acknowledgment.CopyFrom(parse_result.data)
-            
-            # Add parsed segments if requested
-            if request.options and request.options.include_raw_segments:
-                response.parsed_segments.extend(parse_result.segments)
-            
-            logger.info(f"Successfully processed EDI message of type {request.message_type}")
-            return response
-            
         except Exception as e:
-            logger.error(f"Error processing EDI message: {str(e)}", exc_info=True)
+            log_exception(logger, "Error processing EDI message: %s", e)
             context.set_code(grpc.StatusCode.INTERNAL)
             context.set_details(f"Internal error: {str(e)}")
-            return edi_service_pb2.ProcessEdiMessageResponse(
-                status=edi_service_pb2.PROCESSING_STATUS_INTERNAL_ERROR,
-                message_type=request.message_type,
-                processed_at=datetime.now().isoformat(),
-                messages=[
-                    edi_service_pb2.ProcessingMessage(
-                        level=edi_service_pb2.MESSAGE_LEVEL_ERROR,
-                        code="INTERNAL_ERROR",
-                        message=f"Internal server error: {str(e)}"
-                    )
-                ]
-            )
+            return self._internal_error_response(edi_service_pb2.ProcessEdiMessageResponse(), message_type, processed_at, e)
     
-    def GetSupportedMessageTypes(self, request: edi_service_pb2.GetSupportedMessageTypesRequest, context: grpc.ServicerContext) -> edi_service_pb2.GetSupportedMessageTypesResponse:
+    async def GetSupportedMessageTypes(self, request: edi_service_pb2.GetSupportedMessageTypesRequest, context: grpc.ServicerContext) -> edi_service_pb2.GetSupportedMessageTypesResponse:
         """
         Get supported EDI message types.
         
@@ -195,25 +271,23 @@ class EdiServiceServicer(edi_service_pb2_grpc.EdiServiceServicer):
             GetSupportedMessageTypesResponse containing list of supported types
         """
         try:
-            logger.info(f"Getting supported message types for customer {request.customer_id}")
+            customer_id = request.customer_id
+            logger.info("Getting supported message types for customer %s", customer_id)
             
             # Filter by customer if specified (could be used for customer-specific configurations)
-            supported_types = self.supported_types
-            if request.customer_id:
+            if customer_id:
                 # In a real implementation, you might filter based on customer capabilities
-                logger.debug(f"Filtering supported types for customer {request.customer_id}")
+                logger.debug("Filtering supported types for customer %s", customer_id)
             
-            return edi_service_pb2.GetSupportedMessageTypesResponse(
-                supported_types=supported_types
-            )
+            return self._supported_types_response
             
         except Exception as e:
-            logger.error(f"Error getting supported message types: {str(e)}", exc_info=True)
+            log_exception(logger, "Error getting supported message types: %s", e)
             context.set_code(grpc.StatusCode.INTERNAL)
             context.set_details(f"Internal error: {str(e)}")
             return edi_service_pb2.GetSupportedMessageTypesResponse()
     
-    def ValidateEdiMessage(self, request: edi_service_pb2.ValidateEdiMessageRequest, context: grpc.ServicerContext) -> edi_service_pb2.ValidateEdiMessageResponse:
+    async def ValidateEdiMessage(self, request: edi_service_pb2.ValidateEdiMessageRequest, context: grpc.ServicerContext) -> edi_service_pb2.ValidateEdiMessageResponse:
         """
         Validate EDI message format without processing.
         
@@ -225,89 +299,391 @@ class EdiServiceServicer(edi_service_pb2_grpc.EdiServiceServicer):
             ValidateEdiMessageResponse containing validation status and messages
         """
         try:
-            logger.info(f"Validating EDI message of type {request.message_type} for customer {request.customer_id}")
+            message_type = request.message_type
+            logger.info("Validating EDI message of type %s for customer %s", message_type, request.customer_id)
             
             # Validate message type is supported
-            if not self._is_message_type_supported(request.message_type):
-                return edi_service_pb2.ValidateEdiMessageResponse(
-                    status=edi_service_pb2.PROCESSING_STATUS_UNSUPPORTED_MESSAGE_TYPE,
-                    messages=[
-                        edi_service_pb2.ProcessingMessage(
-                            level=edi_service_pb2.MESSAGE_LEVEL_ERROR,
-                            code="UNSUPPORTED_MESSAGE_TYPE",
-                            message=f"Message type {request.message_type} is not supported"
-                        )
-                    ]
+            if message_type not in self._supported_codes:
+                return _error_response(
+                    edi_service_pb2.ValidateEdiMessageResponse(),
+                    edi_service_pb2.PROCESSING_STATUS_UNSUPPORTED_MESSAGE_TYPE,
+                    "UNSUPPORTED_MESSAGE_TYPE",
+                    f"Message type {message_type} is not supported"
                 )
             
-            # Perform format validation
-            validation_result = self.validator.validate_format(request.edi_message, request.message_type)
+            # Reject oversized payloads before paying for a full validation pass
+            message_length = _utf8_length(request.edi_message)
+            if message_length > self._max_edi_message_bytes:
+                context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+                context.set_details("EDI message too large")
+                return self._too_large_response(edi_service_pb2.ValidateEdiMessageResponse(), message_length)
             
-            # Detect EDI version and message type
-            detected_version = self.validator.detect_edi_version(request.edi_message)
-            detected_message_type = self.validator.detect_message_type(request.edi_message)
+            return await self._run_blocking(self._validate_supported_message, request)
             
-            return edi_service_pb2.ValidateEdiMessageResponse(
-                status=edi_service_pb2.PROCESSING_STATUS_SUCCESS if validation_result.is_valid else edi_service_pb2.PROCESSING_STATUS_VALIDATION_ERROR,
-                messages=validation_result.messages,
-                edi_version=detected_version,
-                detected_message_type=detected_message_type
+        except Exception as e:
+            log_exception(logger, "Error validating EDI message: %s", e)
+            context.set_code(grpc.StatusCode.INTERNAL)
+            context.set_details(f"Internal error: {str(e)}")
+            return _error_response(
+                edi_service_pb2.ValidateEdiMessageResponse(),
+                edi_service_pb2.PROCESSING_STATUS_INTERNAL_ERROR,
+                "INTERNAL_ERROR",
+                f"Internal server error: {str(e)}"
             )
+    
+    async def ProcessEdiMessageBatch(self, request: edi_service_pb2.ProcessEdiMessageBatchRequest, context: grpc.ServicerContext) -> edi_service_pb2.ProcessEdiMessageBatchResponse:
+        """
+        Process a batch of EDI messages in a single call.
+        
+        Each message is handled as it would be by ProcessEdiMessage, except that a failing
+        message is reported in its own response instead of failing the whole call.
+        
+        Args:
+            request: The batch of EDI message processing requests
+            context: gRPC service context
+            
+        Returns:
+            ProcessEdiMessageBatchResponse with one response per request, in request order
+        """
+        try:
+            logger.info("Processing batch of %s EDI messages", len(request.requests))
+            
+            # The whole batch is CPU-bound; hand it to the executor in one hop
+            return await self._run_blocking(self._process_batch, request.requests)
             
         except Exception as e:
-            logger.error(f"Error validating EDI message: {str(e)}", exc_info=True)
+            log_exception(logger, "Error processing EDI message batch: %s", e)
             context.set_code(grpc.StatusCode.INTERNAL)
             context.set_details(f"Internal error: {str(e)}")
-            return edi_service_pb2.ValidateEdiMessageResponse(
-                status=edi_service_pb2.PROCESSING_STATUS_INTERNAL_ERROR,
-                messages=[
-                    edi_service_pb2.ProcessingMessage(
-                        level=edi_service_pb2.MESSAGE_LEVEL_ERROR,
-                        code="INTERNAL_ERROR",
-                        message=f"Internal server error: {str(e)}"
+            return edi_service_pb2.ProcessEdiMessageBatchResponse()
+    
+    async def ProcessEdiMessageStream(self, request_iterator: AsyncIterator[edi_service_pb2.EdiChunk], context: grpc.ServicerContext) -> edi_service_pb2.ProcessEdiMessageResponse:
+        """
+        Process an EDI message streamed in chunks.
+        
+        Message type, customer and options are taken from the first chunk. Segments are
+        split out as chunks arrive, and the message is parsed once the client half-closes.
+        
+        Args:
+            request_iterator: Stream of EDI message chunks
+            context: gRPC service context
+            
+        Returns:
+            ProcessEdiMessageResponse containing parsed data and processing status
+        """
+        processed_at = datetime.now().isoformat()
+        message_type = ""
+        
+        try:
+            stream_parser = None
+            request = None
+            # The full text is only retained when format validation needs it
+            retained_chunks = None
+            message_length = 0
+            max_message_length = self._max_edi_message_bytes
+            
+            async for chunk in request_iterator:
+                if stream_parser is None:
+                    message_type = chunk.message_type
+                    logger.info("Processing streamed EDI message of type %s for customer %s", message_type, chunk.customer_id)
+                    
+                    # Validate message type is supported
+                    if message_type not in self._supported_codes:
+                        context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+                        context.set_details(f"Unsupported message type: {message_type}")
+                        return self._unsupported_response(edi_service_pb2.ProcessEdiMessageResponse(), message_type, processed_at)
+                    
+                    request = edi_service_pb2.ProcessEdiMessageRequest(
+                        message_type=message_type,
+                        customer_id=chunk.customer_id,
+                        options=chunk.options
+                    )
+                    stream_parser = self.parser.create_stream_parser(message_type)
+                    if chunk.options.validate_format:
+                        retained_chunks = []
+                
+                content = chunk.content
+                message_length += _utf8_length(content)
+                if message_length > max_message_length:
+                    context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+                    context.set_details("EDI message too large")
+                    return self._too_large_response(
+                        edi_service_pb2.ProcessEdiMessageResponse(), message_length,
+                        message_type=message_type, processed_at=processed_at
                     )
-                ]
+                
+                if retained_chunks is not None:
+                    retained_chunks.append(content)
+                # Splitting a large chunk is CPU-bound; keep it off the event loop.
+                # Chunks are fed one at a time, so the parser is never shared
+                if len(content) >= STREAM_FEED_EXECUTOR_THRESHOLD:
+                    await self._run_blocking(stream_parser.feed, content)
+                else:
+                    stream_parser.feed(content)
+            
+            if stream_parser is None:
+                context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+                context.set_details("Empty EDI message stream")
+                return edi_service_pb2.ProcessEdiMessageResponse(processed_at=processed_at)
+            
+            if retained_chunks is not None:
+                request.edi_message = "".join(retained_chunks)
+            
+            # Validation and the final parse run in the executor as well
+            return await self._run_blocking(
+                self._process_supported_message, request, processed_at, edi_service_pb2.ProcessEdiMessageResponse(), stream_parser
             )
+            
+        except Exception as e:
+            log_exception(logger, "Error processing streamed EDI message: %s", e)
+            context.set_code(grpc.StatusCode.INTERNAL)
+            context.set_details(f"Internal error: {str(e)}")
+            return self._internal_error_response(edi_service_pb2.ProcessEdiMessageResponse(), message_type, processed_at, e)
+    
+    async def _get_supported_message_types_serialized(self, request: edi_service_pb2.GetSupportedMessageTypesRequest, context: grpc.ServicerContext) -> bytes:
+        """GetSupportedMessageTypes returning the serialized response, for registration without a serializer."""
+        response = await self.GetSupportedMessageTypes(request, context)
+        if response is self._supported_types_response:
+            return self._supported_types_bytes
+        return response.SerializeToString()
+    
+    def _process_batch(self, requests: Sequence[edi_service_pb2.ProcessEdiMessageRequest]) -> edi_service_pb2.ProcessEdiMessageBatchResponse:
+        """Process each request of a batch (CPU-bound, runs in the executor)."""
+        # One timestamp for the whole batch
+        processed_at = datetime.now().isoformat()
+        supported_codes = self._supported_codes
+        max_message_length = self._max_edi_message_bytes
+        
+        batch_response = edi_service_pb2.ProcessEdiMessageBatchResponse()
+        # Each response is built directly in its batch slot; appending a
+        # finished response would deep-copy it, parsed segments and all
+        add_response = batch_response.responses.add
+        for edi_request in requests:
+            response = add_response()
+            message_type = edi_request.message_type
+            if message_type not in supported_codes:
+                self._unsupported_response(response, message_type, processed_at)
+                continue
+            message_length = _utf8_length(edi_request.edi_message)
+            if message_length > max_message_length:
+                self._too_large_response(
+                    response, message_length,
+                    message_type=message_type, processed_at=processed_at
+                )
+                continue
+            try:
+                self._process_supported_message(edi_request, processed_at, response)
+            except Exception as e:
+                log_exception(logger, "Error processing EDI message in batch: %s", e)
+                self._internal_error_response(response, message_type, processed_at, e)
+        
+        return batch_response
     
-    def _is_message_type_supported(self, message_type: str) -> bool:
-        """Check if a message type is supported."""
-        return any(msg_type.code == message_type for msg_type in self.supported_types)
+    def _process_supported_message(self, request: edi_service_pb2.ProcessEdiMessageRequest, processed_at: str, response: edi_service_pb2.ProcessEdiMessageResponse, stream_parser: Optional[EdiStreamParser] = None) -> edi_service_pb2.ProcessEdiMessageResponse:
+        """
+        Validate and parse a message of a supported type (CPU-bound, runs in the executor).
+        
+        The result is written into response, which must be empty, and returned. When
+        stream_parser is given it has already been fed the message and is used in
+        place of parsing request.edi_message.
+        """
+        # Read request fields once; each protobuf attribute access goes through a descriptor
+        message_type = request.message_type
+        edi_message = request.edi_message
+        options = request.options
+        
+        # Validate EDI message format if requested
+        messages = []
+        if options.validate_format:
+            validation_result = self.validator.validate_format(edi_message, message_type)
+            if not validation_result.is_valid:
+                messages.extend(validation_result.messages)
+                if validation_result.has_errors:
+                    response.status = edi_service_pb2.PROCESSING_STATUS_VALIDATION_ERROR
+                    response.message_type = message_type
+                    response.processed_at = processed_at
+                    response.messages.extend(messages)
+                    return response
+        
+        # The parser fills the response's parsed_data field in place; copying
+        # a finished message in would walk every field again
+        response.message_type = message_type
+        response.processed_at = processed_at
+        parsed_data = getattr(response, self._parsed_data_fields[message_type])
+        # Mark the oneof as set even if no segment populates it
+        parsed_data.SetInParent()
+        
+        # Parse the EDI message; raw segments, if requested, are written
+        # straight into the response, otherwise they are never built
+        include_segments = options.include_raw_segments
+        if stream_parser is not None:
+            parse_result = stream_parser.finish(parsed_data, response, include_segments)
+        else:
+            parse_result = self.parser.parse_message(edi_message, message_type, parsed_data, response, include_segments)
+        
+        if not parse_result.success:
+            return _error_response(
+                response,
+                edi_service_pb2.PROCESSING_STATUS_PARSING_ERROR,
+                "PARSING_ERROR",
+                parse_result.error_message,
+                message_type=message_type,
+                processed_at=processed_at
+            )
+        
+        # Validate business rules if requested
+        if options.validate_business_rules:
+            business_validation = self.validator.validate_business_rules(parse_result.data, message_type)
+            if not business_validation.is_valid:
+                messages.extend(business_validation.messages)
+                if business_validation.has_errors:
+                    # Drop the parsed data; only the status and messages are reported
+                    response.Clear()
+                    response.status = edi_service_pb2.PROCESSING_STATUS_BUSINESS_RULE_ERROR
+                    response.message_type = message_type
+                    response.processed_at = processed_at
+                    response.messages.extend(messages)
+                    return response
+        
+        response.status = edi_service_pb2.PROCESSING_STATUS_SUCCESS
+        response.messages.extend(messages)
+        
+        logger.info("Successfully processed EDI message of type %s", message_type)
+        return response
+    
+    def _validate_supported_message(self, request: edi_service_pb2.ValidateEdiMessageRequest) -> edi_service_pb2.ValidateEdiMessageResponse:
+        """Validate a message of a supported type (CPU-bound, runs in the executor)."""
+        edi_message = request.edi_message
+        
+        # Perform format validation
+        validation_result = self.validator.validate_format(edi_message, request.message_type)
+        
+        # Detect EDI version and message type
+        detected_version = self.validator.detect_edi_version(edi_message)
+        detected_message_type = self.validator.detect_message_type(edi_message)
+        
+        return edi_service_pb2.ValidateEdiMessageResponse(
+            status=edi_service_pb2.PROCESSING_STATUS_SUCCESS if validation_result.is_valid else edi_service_pb2.PROCESSING_STATUS_VALIDATION_ERROR,
+            messages=validation_result.messages,
+            edi_version=detected_version,
+            detected_message_type=detected_message_type
+        )
+    
+    @staticmethod
+    def _unsupported_response(response: edi_service_pb2.ProcessEdiMessageResponse, message_type: str, processed_at: str) -> edi_service_pb2.ProcessEdiMessageResponse:
+        """Fill response for a message type the service does not support."""
+        return _error_response(
+            response,
+            edi_service_pb2.PROCESSING_STATUS_UNSUPPORTED_MESSAGE_TYPE,
+            "UNSUPPORTED_MESSAGE_TYPE",
+            f"Message type {message_type} is not supported",
+            message_type=message_type,
+            processed_at=processed_at
+        )
+    
+    def _too_large_response(self, response: _T, message_length: int, **fields: Any) -> _T:
+        """Fill response for an EDI payload over the configured size limit."""
+        return _error_response(
+            response,
+            edi_service_pb2.PROCESSING_STATUS_VALIDATION_ERROR,
+            "MESSAGE_TOO_LARGE",
+            f"EDI message is {message_length} bytes; the limit is {self._max_edi_message_bytes}",
+            **fields
+        )
+    
+    @staticmethod
+    def _internal_error_response(response: edi_service_pb2.ProcessEdiMessageResponse, message_type: str, processed_at: str, error: Exception) -> edi_service_pb2.ProcessEdiMessageResponse:
+        """Fill response for an unexpected processing failure."""
+        return _error_response(
+            response,
+            edi_service_pb2.PROCESSING_STATUS_INTERNAL_ERROR,
+            "INTERNAL_ERROR",
+            f"Internal server error: {str(error)}",
+            message_type=message_type,
+            processed_at=processed_at
+        )
+    
+    async def _run_blocking(self, func: Callable[..., _T], *args: Any) -> _T:
+        """Run a CPU-bound call in the executor without blocking the event loop."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(func, *args))
 
 
-def serve(host: str = "localhost", port: int = 50051, max_workers: int = 10):
+def add_servicer_to_server(servicer: EdiServiceServicer, server: grpc.aio.Server) -> None:
     """
-    Start the gRPC server.
+    Register the EDI servicer with a server.
+    
+    GetSupportedMessageTypes is served from pre-serialized bytes; everything
+    else goes through the generated handlers.
+    
+    Args:
+        servicer: The EDI service implementation
+        server: The asyncio gRPC server
+    """
+    service_name = edi_service_pb2.DESCRIPTOR.services_by_name["EdiService"].full_name
+    # Generic handlers are consulted in registration order, so this handler
+    # takes precedence over the generated one for GetSupportedMessageTypes.
+    # Its behavior already returns bytes, so no response serializer is set.
+    cached_handler = grpc.method_handlers_generic_handler(service_name, {
+        "GetSupportedMessageTypes": grpc.unary_unary_rpc_method_handler(
+            servicer._get_supported_message_types_serialized,
+            request_deserializer=edi_service_pb2.GetSupportedMessageTypesRequest.FromString,
+        ),
+    })
+    server.add_generic_rpc_handlers((cached_handler,))
+    edi_service_pb2_grpc.add_EdiServiceServicer_to_server(servicer, server)
+
+
+async def serve_async(config: ServerConfig):
+    """
+    Run the asyncio gRPC server until it is terminated.
     
     Args:
-        host: Server host address
-        port: Server port
-        max_workers: Maximum number of worker threads
+        config: Server configuration
     """
-    server = grpc.server(futures.ThreadPoolExecutor(max_workers=max_workers))
-    edi_service_pb2_grpc.add_EdiServiceServicer_to_server(EdiServiceServicer(), server)
+    _check_protobuf_backend()
     
-    listen_addr = f"{host}:{port}"
+    server = grpc.aio.server(
+        options=config.grpc_options(),
+        # EDI text is highly repetitive and compresses well
+        compression=grpc.Compression.Gzip,
+    )
+    executor = futures.ThreadPoolExecutor(max_workers=config.max_workers)
+    add_servicer_to_server(EdiServiceServicer(executor, config.max_edi_message_bytes), server)
+    
+    listen_addr = config.listen_addr
     server.add_insecure_port(listen_addr)
     
-    logger.info(f"Starting EDI service on {listen_addr}")
-    server.start()
+    logger.info("Starting EDI service on %s", listen_addr)
+    await server.start()
+    
+    try:
+        await server.wait_for_termination()
+    finally:
+        await server.stop(0)
+        executor.shutdown(wait=False)
+
+
+def serve(config: Optional[ServerConfig] = None):
+    """
+    Start the gRPC server.
+    
+    Args:
+        config: Server configuration; read from the environment when omitted
+    """
+    if config is None:
+        config = ServerConfig.from_env()
     
+    _install_uvloop()
     try:
-        server.wait_for_termination()
+        asyncio.run(serve_async(config))
     except KeyboardInterrupt:
         logger.info("Shutting down EDI service")
-        server.stop(0)
 
 
 def main():
     """Main entry point for the service."""
-    import os
-    
-    host = os.getenv("EDI_SERVICE_HOST", "localhost")
-    port = int(os.getenv("EDI_SERVICE_PORT", "50051"))
-    max_workers = int(os.getenv("EDI_MAX_WORKERS", "10"))
-    
-    serve(host, port, max_workers)
+    serve(ServerConfig.from_env())
 
 
 if __name__ == "__main__":
@@ -5,15 +5,87 @@ This module handles validation of EDI messages for format and business rules.
 """
 
 import re
+import sys
+import hashlib
 import logging
-from typing import Dict, List, Optional, Any
+import threading
+from collections import OrderedDict, deque
+from typing import Callable, Dict, FrozenSet, Iterator, List, Optional, Any, Tuple
 from dataclasses import dataclass
 
 from generated import edi_service_pb2
-from src.utils import setup_logging
+from src.edi_parser import split_lines
+from src.utils import setup_logging, log_exception
 
 logger = setup_logging(__name__)
 
+_intern = sys.intern
+
+# Module-level aliases save two attribute lookups per emitted message
+_ProcessingMessage = edi_service_pb2.ProcessingMessage
+_ERROR = edi_service_pb2.MESSAGE_LEVEL_ERROR
+_WARNING = edi_service_pb2.MESSAGE_LEVEL_WARNING
+
+# Required/optional segments per message type; required segments are reported in this order
+_SEGMENT_PATTERNS: Dict[str, Dict[str, Tuple[str, ...]]] = {
+    "850": {
+        "required": ("ISA", "GS", "ST", "BEG", "SE", "GE", "IEA"),
+        "optional": ("REF", "N1", "N3", "N4", "PO1", "CTT")
+    },
+    "810": {
+        "required": ("ISA", "GS", "ST", "BIG", "SE", "GE", "IEA"),
+        "optional": ("REF", "N1", "N3", "N4", "IT1", "TDS", "CTT")
+    },
+    "856": {
+        "required": ("ISA", "GS", "ST", "BSN", "SE", "GE", "IEA"),
+        "optional": ("REF", "N1", "N3", "N4", "HL", "PRF", "TD1", "TD5")
+    },
+    "997": {
+        "required": ("ISA", "GS", "ST", "AK1", "SE", "GE", "IEA"),
+        "optional": ("AK2", "AK5", "AK9")
+    }
+}
+
+_REQUIRED_SEGMENT_SETS: Dict[str, FrozenSet[str]] = {
+    message_type: frozenset(patterns["required"])
+    for message_type, patterns in _SEGMENT_PATTERNS.items()
+}
+
+# ISA12 interchange control version number -> EDI version
+_ISA_VERSIONS: Dict[str, str] = {
+    "00401": "004010",
+    "00501": "005010",
+}
+
+_ST_PATTERN = re.compile(r"ST\*(\d{3})")
+
+# Number of validate_format results kept for repeated payloads
+FORMAT_CACHE_SIZE = 1024
+
+# Envelope segments expected at the start and end of every interchange
+_LEADING_SEGMENTS = ("ISA", "GS", "ST")
+_TRAILING_SEGMENTS = ("SE", "GE", "IEA")
+
+# Segment ID -> (minimum element count, error code, message)
+_ELEMENT_MINIMUMS: Dict[str, Tuple[int, str, str]] = {
+    "ST": (2, "INSUFFICIENT_ST_ELEMENTS", "ST segment must have at least 2 elements"),
+    "BEG": (3, "INSUFFICIENT_BEG_ELEMENTS", "BEG segment must have at least 3 elements"),
+}
+
+# Maximum lengths of ISA01-ISA16
+_ISA_ELEMENT_LENGTHS = (2, 10, 2, 10, 2, 15, 2, 15, 6, 4, 1, 5, 9, 1, 1, 1)
+
+# Prototypes for messages emitted in loops; CopyFrom plus two field
+# assignments is cheaper than keyword construction. Never mutated
+_MISSING_SEGMENT_TEMPLATE = _ProcessingMessage(
+    level=_ERROR,
+    code="MISSING_REQUIRED_SEGMENT"
+)
+_ISA_ELEMENT_TOO_LONG_TEMPLATE = _ProcessingMessage(
+    level=_WARNING,
+    code="ISA_ELEMENT_TOO_LONG"
+)
+
 
 @dataclass
 class ValidationResult:
@@ -23,39 +95,53 @@ class ValidationResult:
     has_errors: bool = False
 
 
+def _copy_validation_result(result: ValidationResult) -> ValidationResult:
+    """Copy a result so callers never share protobuf messages with the cache."""
+    messages = []
+    for message in result.messages:
+        copied = _ProcessingMessage()
+        copied.CopyFrom(message)
+        messages.append(copied)
+    return ValidationResult(is_valid=result.is_valid, messages=messages, has_errors=result.has_errors)
+
+
 class EdiValidator:
     """Validator for EDI messages."""
     
-    def __init__(self):
-        """Initialize the EDI validator."""
-        self.segment_patterns = {
-            "850": {
-                "required": ["ISA", "GS", "ST", "BEG", "SE", "GE", "IEA"],
-                "optional": ["REF", "N1", "N3", "N4", "PO1", "CTT"]
-            },
-            "810": {
-                "required": ["ISA", "GS", "ST", "BIG", "SE", "GE", "IEA"],
-                "optional": ["REF", "N1", "N3", "N4", "IT1", "TDS", "CTT"]
-            },
-            "856": {
-                "required": ["ISA", "GS", "ST", "BSN", "SE", "GE", "IEA"],
-                "optional": ["REF", "N1", "N3", "N4", "HL", "PRF", "TD1", "TD5"]
-            },
-            "997": {
-                "required": ["ISA", "GS", "ST", "AK1", "SE", "GE", "IEA"],
-                "optional": ["AK2", "AK5", "AK9"]
-            }
-        }
+    def __init__(self, format_cache_size: int = FORMAT_CACHE_SIZE):
+        """
+        Initialize the EDI validator.
         
-        self.edi_version_patterns = {
-            "004010": r"ISA\*[^*]*\*[^*]*\*[^*]*\*[^*]*\*[^*]*\*[^*]*\*[^*]*\*[^*]*\*[^*]*\*[^*]*\*[^*]*\*[^*]*\*[^*]*\*[^*]*\*[^*]*\*[^*]*\*004010",
-            "005010": r"ISA\*[^*]*\*[^*]*\*[^*]*\*[^*]*\*[^*]*\*[^*]*\*[^*]*\*[^*]*\*[^*]*\*[^*]*\*[^*]*\*[^*]*\*[^*]*\*[^*]*\*[^*]*\*[^*]*\*[^*]*\*005010"
+        Args:
+            format_cache_size: Number of validate_format results to keep for
+                repeated payloads; 0 disables the cache
+        """
+        # Shared, read-only tables; nothing here is mutated per call, so one
+        # validator can serve every worker thread; only the result cache
+        # below needs a lock
+        self.segment_patterns = _SEGMENT_PATTERNS
+        self._required_sets = _REQUIRED_SEGMENT_SETS
+        self._business_rules: Dict[str, Callable[[Any], ValidationResult]] = {
+            "850": self._validate_purchase_order_rules,
+            "810": self._validate_invoice_rules,
+            "856": self._validate_asn_rules,
+            "997": self._validate_functional_ack_rules,
         }
+        self.edi_versions = _ISA_VERSIONS
+        
+        # Retries and replays resubmit identical payloads; results are keyed
+        # by a digest so the cache never holds on to the messages themselves
+        self._format_cache_size = format_cache_size
+        self._format_cache: "OrderedDict[Tuple[bytes, str], ValidationResult]" = OrderedDict()
+        self._format_cache_lock = threading.Lock()
     
     def validate_format(self, edi_message: str, message_type: str) -> ValidationResult:
         """
         Validate EDI message format.
         
+        Results are cached per (message digest, message type); every call
+        returns its own copy of the messages.
+        
         Args:
             edi_message: Raw EDI message content
             message_type: EDI message type (850, 810, 856, 997)
@@ -63,28 +149,51 @@ class EdiValidator:
         Returns:
             ValidationResult containing validation status and messages
         """
+        if self._format_cache_size <= 0:
+            return self._validate_format(edi_message, message_type)
+        
+        key = (hashlib.blake2b(edi_message.encode('utf-8'), digest_size=16).digest(), message_type)
+        cache = self._format_cache
+        with self._format_cache_lock:
+            result = cache.get(key)
+            if result is not None:
+                cache.move_to_end(key)
+        
+        if result is None:
+            result = self._validate_format(edi_message, message_type)
+            with self._format_cache_lock:
+                cache[key] = result
+                if len(cache) > self._format_cache_size:
+                    cache.popitem(last=False)
+        
+        return _copy_validation_result(result)
+    
+    def _validate_format(self, edi_message: str, message_type: str) -> ValidationResult:
+        """Validate EDI message format without consulting the cache."""
         messages = []
         has_errors = False
         
         try:
-            logger.debug(f"Validating EDI message format for type {message_type}")
+            logger.debug("Validating EDI message format for type %s", message_type)
             
             # Check if message type is supported
             if message_type not in self.segment_patterns:
-                messages.append(edi_service_pb2.ProcessingMessage(
-                    level=edi_service_pb2.MESSAGE_LEVEL_ERROR,
+                messages.append(_ProcessingMessage(
+                    level=_ERROR,
                     code="UNSUPPORTED_MESSAGE_TYPE",
                     message=f"Message type {message_type} is not supported"
                 ))
                 has_errors = True
                 return ValidationResult(is_valid=False, messages=messages, has_errors=has_errors)
             
-            # Split message into segments
-            segments = self._split_into_segments(edi_message)
+            # Segments are checked as they are split, in a single pass; no
+            # segment list is built
+            segments = self._iter_segments(edi_message)
+            first_segment = next(segments, None)
             
-            if not segments:
-                messages.append(edi_service_pb2.ProcessingMessage(
-                    level=edi_service_pb2.MESSAGE_LEVEL_ERROR,
+            if first_segment is None:
+                messages.append(_ProcessingMessage(
+                    level=_ERROR,
                     code="EMPTY_MESSAGE",
                     message="EDI message is empty or contains no valid segments"
                 ))
@@ -92,46 +201,76 @@ class EdiValidator:
                 return ValidationResult(is_valid=False, messages=messages, has_errors=has_errors)
             
             # Validate ISA segment (Interchange Control Header)
-            isa_validation = self._validate_isa_segment(segments[0])
+            isa_segment_id, isa_elements, _ = first_segment
+            isa_validation = self._validate_isa_segment(isa_segment_id, isa_elements)
             messages.extend(isa_validation.messages)
             if isa_validation.has_errors:
-                has_errors = True
-            
-            # Validate required segments
-            required_segments = self.segment_patterns[message_type]["required"]
-            segment_ids = [seg["segment_id"] for seg in segments]
+                # Without a usable interchange header the remaining checks
+                # would only report follow-on errors
+                return ValidationResult(is_valid=False, messages=messages, has_errors=True)
             
-            for required_segment in required_segments:
-                if required_segment not in segment_ids:
-                    messages.append(edi_service_pb2.ProcessingMessage(
-                        level=edi_service_pb2.MESSAGE_LEVEL_ERROR,
-                        code="MISSING_REQUIRED_SEGMENT",
-                        message=f"Required segment {required_segment} is missing",
-                        field=required_segment
+            # Walk the remaining segments once, collecting what the
+            # required, structure and element checks need
+            present_segments = {isa_segment_id}
+            leading_ids = [isa_segment_id]
+            trailing_ids = deque(leading_ids, maxlen=len(_TRAILING_SEGMENTS))
+            element_messages = []
+            segment_count = 1
+            for segment_id, elements, line_number in segments:
+                segment_count += 1
+                present_segments.add(segment_id)
+                if segment_count <= len(_LEADING_SEGMENTS):
+                    leading_ids.append(segment_id)
+                trailing_ids.append(segment_id)
+                
+                minimum = _ELEMENT_MINIMUMS.get(segment_id)
+                if minimum is not None and len(elements) < minimum[0]:
+                    element_messages.append(_ProcessingMessage(
+                        level=_ERROR,
+                        code=minimum[1],
+                        message=minimum[2],
+                        field=segment_id,
+                        line_number=line_number
                     ))
-                    has_errors = True
+            
+            # Validate required segments; one set difference finds what is
+            # missing, which is then reported in the table's order
+            missing_segments = self._required_sets[message_type].difference(present_segments)
+            if missing_segments:
+                for required_segment in self.segment_patterns[message_type]["required"]:
+                    if required_segment in missing_segments:
+                        missing_message = _ProcessingMessage()
+                        missing_message.CopyFrom(_MISSING_SEGMENT_TEMPLATE)
+                        missing_message.message = f"Required segment {required_segment} is missing"
+                        missing_message.field = required_segment
+                        messages.append(missing_message)
+                has_errors = True
+            
+            # Fewer than three segments cannot hold both envelopes; the
+            # missing segments above already explain why
+            if segment_count < 3:
+                return ValidationResult(is_valid=False, messages=messages, has_errors=True)
             
             # Validate segment order and structure
-            structure_validation = self._validate_segment_structure(segments, message_type)
+            structure_validation = self._validate_segment_structure(leading_ids, tuple(trailing_ids))
             messages.extend(structure_validation.messages)
             if structure_validation.has_errors:
                 has_errors = True
             
-            # Validate segment elements
-            element_validation = self._validate_segment_elements(segments, message_type)
-            messages.extend(element_validation.messages)
-            if element_validation.has_errors:
+            # Element checks were already run during the walk
+            if element_messages:
+                messages.extend(element_messages)
                 has_errors = True
             
             is_valid = not has_errors
-            logger.debug(f"Format validation completed. Valid: {is_valid}, Errors: {has_errors}")
+            logger.debug("Format validation completed. Valid: %s, Errors: %s", is_valid, has_errors)
             
             return ValidationResult(is_valid=is_valid, messages=messages, has_errors=has_errors)
             
         except Exception as e:
-            logger.error(f"Error during format validation: {str(e)}", exc_info=True)
-            messages.append(edi_service_pb2.ProcessingMessage(
-                level=edi_service_pb2.MESSAGE_LEVEL_ERROR,
+            log_exception(logger, "Error during format validation: %s", e)
+            messages.append(_ProcessingMessage(
+                level=_ERROR,
                 code="VALIDATION_ERROR",
                 message=f"Validation error: {str(e)}"
             ))
@@ -152,94 +291,84 @@ class EdiValidator:
         has_errors = False
         
         try:
-            logger.debug(f"Validating business rules for type {message_type}")
+            logger.debug("Validating business rules for type %s", message_type)
             
-            if message_type == "850":
-                # Purchase Order business rules
-                po_validation = self._validate_purchase_order_rules(parsed_data)
-                messages.extend(po_validation.messages)
-                has_errors = po_validation.has_errors
-                
-            elif message_type == "810":
-                # Invoice business rules
-                invoice_validation = self._validate_invoice_rules(parsed_data)
-                messages.extend(invoice_validation.messages)
-                has_errors = invoice_validation.has_errors
-                
-            elif message_type == "856":
-                # Advance Ship Notice business rules
-                asn_validation = self._validate_asn_rules(parsed_data)
-                messages.extend(asn_validation.messages)
-                has_errors = asn_validation.has_errors
-                
-            elif message_type == "997":
-                # Functional Acknowledgment business rules
-                fa_validation = self._validate_functional_ack_rules(parsed_data)
-                messages.extend(fa_validation.messages)
-                has_errors = fa_validation.has_errors
+            validate_rules = self._business_rules.get(message_type)
+            if validate_rules is not None:
+                rules_validation = validate_rules(parsed_data)
+                messages.extend(rules_validation.messages)
+                has_errors = rules_validation.has_errors
             
             is_valid = not has_errors
-            logger.debug(f"Business rules validation completed. Valid: {is_valid}, Errors: {has_errors}")
+            logger.debug("Business rules validation completed. Valid: %s, Errors: %s", is_valid, has_errors)
             
             return ValidationResult(is_valid=is_valid, messages=messages, has_errors=has_errors)
             
         except Exception as e:
-            logger.error(f"Error during business rules validation: {str(e)}", exc_info=True)
-            messages.append(edi_service_pb2.ProcessingMessage(
-                level=edi_service_pb2.MESSAGE_LEVEL_ERROR,
+            log_exception(logger, "Error during business rules validation: %s", e)
+            messages.append(_ProcessingMessage(
+                level=_ERROR,
                 code="BUSINESS_RULE_ERROR",
                 message=f"Business rule validation error: {str(e)}"
             ))
             return ValidationResult(is_valid=False, messages=messages, has_errors=True)
     
     def detect_edi_version(self, edi_message: str) -> str:
-        """Detect EDI version from message."""
-        for version, pattern in self.edi_version_patterns.items():
-            if re.search(pattern, edi_message):
-                return version
-        return "Unknown"
+        """Detect EDI version from the ISA12 interchange control version number."""
+        start = edi_message.find("ISA*")
+        if start < 0:
+            return "Unknown"
+        
+        # Walk the ISA header with str.find rather than a regex: skip the
+        # first eleven element separators to land on ISA12, staying inside
+        # the ISA segment, which ends at the first "~" or line break
+        stop = len(edi_message)
+        for terminator in ("~", "\r", "\n"):
+            end = edi_message.find(terminator, start, stop)
+            if end >= 0:
+                stop = end
+        position = start + 4
+        for _ in range(11):
+            position = edi_message.find("*", position, stop) + 1
+            if not position:
+                return "Unknown"
+        
+        end = edi_message.find("*", position, stop)
+        if end < 0:
+            return "Unknown"
+        return _ISA_VERSIONS.get(edi_message[position:end], "Unknown")
     
     def detect_message_type(self, edi_message: str) -> str:
         """Detect message type from ST segment."""
-        st_match = re.search(r"ST\*(\d{3})", edi_message)
+        st_match = _ST_PATTERN.search(edi_message)
         if st_match:
             return st_match.group(1)
         return "Unknown"
     
-    def _split_into_segments(self, edi_message: str) -> List[Dict[str, Any]]:
-        """Split EDI message into segments."""
-        segments = []
-        lines = edi_message.strip().split('\n')
-        
-        for i, line in enumerate(lines):
-            line = line.strip()
-            if not line:
-                continue
+    def _iter_segments(self, edi_message: str) -> Iterator[Tuple[str, List[str], int]]:
+        """Yield (segment_id, elements, line_number) for each segment in the message."""
+        # Stay on C-level str methods, as EdiParser._split_lines does: peel
+        # off the segment ID with partition rather than slicing a copy of
+        # the full element list. Lines are split exactly as the parser
+        # splits them, and segments end at "~" or a line break
+        for line_number, line in enumerate(split_lines(edi_message), 1):
+            for raw_segment in line.split('~'):
+                segment_id, separator, raw_elements = raw_segment.strip().partition('*')
+                if not separator:
+                    continue
                 
-            # Split segment into elements
-            elements = line.split('*')
-            if len(elements) < 2:
-                continue
-                
-            segment_id = elements[0]
-            segment_data = {
-                'segment_id': segment_id,
-                'elements': elements[1:],
-                'line_number': i + 1,
-                'position': len(segments) + 1
-            }
-            segments.append(segment_data)
-        
-        return segments
+                # Interned IDs make the comparisons against segment literals
+                # and the required-set lookups succeed on the identity check
+                yield _intern(segment_id), raw_elements.split('*'), line_number
     
-    def _validate_isa_segment(self, isa_segment: Dict[str, Any]) -> ValidationResult:
+    def _validate_isa_segment(self, segment_id: str, elements: List[str]) -> ValidationResult:
         """Validate ISA segment structure."""
         messages = []
         has_errors = False
         
-        if isa_segment["segment_id"] != "ISA":
-            messages.append(edi_service_pb2.ProcessingMessage(
-                level=edi_service_pb2.MESSAGE_LEVEL_ERROR,
+        if segment_id != "ISA":
+            messages.append(_ProcessingMessage(
+                level=_ERROR,
                 code="INVALID_ISA_SEGMENT",
                 message="First segment must be ISA",
                 field="ISA"
@@ -247,54 +376,58 @@ class EdiValidator:
             has_errors = True
             return ValidationResult(is_valid=False, messages=messages, has_errors=has_errors)
         
-        elements = isa_segment["elements"]
         if len(elements) < 16:
-            messages.append(edi_service_pb2.ProcessingMessage(
-                level=edi_service_pb2.MESSAGE_LEVEL_ERROR,
+            messages.append(_ProcessingMessage(
+                level=_ERROR,
                 code="INSUFFICIENT_ISA_ELEMENTS",
                 message="ISA segment must have at least 16 elements",
                 field="ISA"
             ))
             has_errors = True
         
-        # Validate ISA element lengths
-        isa_element_lengths = [2, 10, 2, 10, 2, 15, 2, 15, 6, 4, 1, 5, 2, 1, 1, 1]
-        for i, expected_length in enumerate(isa_element_lengths):
-            if i < len(elements):
-                element = elements[i]
-                if len(element) > expected_length:
-                    messages.append(edi_service_pb2.ProcessingMessage(
-                        level=edi_service_pb2.MESSAGE_LEVEL_WARNING,
-                        code="ISA_ELEMENT_TOO_LONG",
-                        message=f"ISA element {i+1} exceeds maximum length of {expected_length}",
-                        field=f"ISA.{i+1}"
-                    ))
+        # Validate ISA element lengths; collect offenders in one comprehension
+        # (zip stops at the shorter side, so a truncated ISA needs no bounds
+        # check) and only build messages when there are any
+        offenders = [
+            (position, expected_length)
+            for position, (element, expected_length) in enumerate(zip(elements, _ISA_ELEMENT_LENGTHS), 1)
+            if len(element) > expected_length
+        ]
+        for position, expected_length in offenders:
+            length_message = _ProcessingMessage()
+            length_message.CopyFrom(_ISA_ELEMENT_TOO_LONG_TEMPLATE)
+            length_message.message = f"ISA element {position} exceeds maximum length of {expected_length}"
+            length_message.field = f"ISA.{position}"
+            messages.append(length_message)
         
         return ValidationResult(is_valid=not has_errors, messages=messages, has_errors=has_errors)
     
-    def _validate_segment_structure(self, segments: List[Dict[str, Any]], message_type: str) -> ValidationResult:
-        """Validate segment structure and order."""
+    def _validate_segment_structure(self, leading_ids: List[str], trailing_ids: Tuple[str, ...]) -> ValidationResult:
+        """
+        Validate segment structure and order.
+        
+        Args:
+            leading_ids: IDs of the first (up to three) segments
+            trailing_ids: IDs of the last (up to three) segments
+        """
         messages = []
         has_errors = False
         
         # Check for proper segment sequence
-        expected_sequence = ["ISA", "GS", "ST"]
-        segment_ids = [seg["segment_id"] for seg in segments]
-        
-        for i, expected_segment in enumerate(expected_sequence):
-            if i < len(segment_ids) and segment_ids[i] != expected_segment:
-                messages.append(edi_service_pb2.ProcessingMessage(
-                    level=edi_service_pb2.MESSAGE_LEVEL_ERROR,
+        for i, (expected_segment, segment_id) in enumerate(zip(_LEADING_SEGMENTS, leading_ids)):
+            if segment_id != expected_segment:
+                messages.append(_ProcessingMessage(
+                    level=_ERROR,
                     code="INVALID_SEGMENT_ORDER",
-                    message=f"Expected {expected_segment} at position {i+1}, found {segment_ids[i]}",
+                    message=f"Expected {expected_segment} at position {i+1}, found {segment_id}",
                     field=expected_segment
                 ))
                 has_errors = True
         
         # Check for proper closing segments
-        if segment_ids[-3:] != ["SE", "GE", "IEA"]:
-            messages.append(edi_service_pb2.ProcessingMessage(
-                level=edi_service_pb2.MESSAGE_LEVEL_ERROR,
+        if trailing_ids != _TRAILING_SEGMENTS:
+            messages.append(_ProcessingMessage(
+                level=_ERROR,
                 code="INVALID_CLOSING_SEGMENTS",
                 message="Message must end with SE, GE, IEA segments",
                 field="closing_segments"
@@ -303,38 +436,6 @@ class EdiValidator:
         
         return ValidationResult(is_valid=not has_errors, messages=messages, has_errors=has_errors)
     
-    def _validate_segment_elements(self, segments: List[Dict[str, Any]], message_type: str) -> ValidationResult:
-        """Validate segment elements."""
-        messages = []
-        has_errors = False
-        
-        for segment in segments:
-            segment_id = segment["segment_id"]
-            elements = segment["elements"]
-            
-            # Basic element validation
-            if segment_id == "ST" and len(elements) < 2:
-                messages.append(edi_service_pb2.ProcessingMessage(
-                    level=edi_service_pb2.MESSAGE_LEVEL_ERROR,
-                    code="INSUFFICIENT_ST_ELEMENTS",
-                    message="ST segment must have at least 2 elements",
-                    field="ST",
-                    line_number=segment["line_number"]
-                ))
-                has_errors = True
-            
-            elif segment_id == "BEG" and len(elements) < 3:
-                messages.append(edi_service_pb2.ProcessingMessage(
-                    level=edi_service_pb2.MESSAGE_LEVEL_ERROR,
-                    code="INSUFFICIENT_BEG_ELEMENTS",
-                    message="BEG segment must have at least 3 elements",
-                    field="BEG",
-                    line_number=segment["line_number"]
-                ))
-                has_errors = True
-        
-        return ValidationResult(is_valid=not has_errors, messages=messages, has_errors=has_errors)
-    
     def _validate_purchase_order_rules(self, po_data: edi_service_pb2.PurchaseOrderData) -> ValidationResult:
         """Validate Purchase Order business rules."""
         messages = []
@@ -342,8 +443,8 @@ class EdiValidator:
         
         # PO number must be present
         if not po_data.po_number:
-            messages.append(edi_service_pb2.ProcessingMessage(
-                level=edi_service_pb2.MESSAGE_LEVEL_ERROR,
+            messages.append(_ProcessingMessage(
+                level=_ERROR,
                 code="MISSING_PO_NUMBER",
                 message="Purchase Order number is required",
                 field="po_number"
@@ -352,33 +453,39 @@ class EdiValidator:
         
         # Must have at least one line item
         if not po_data.line_items:
-            messages.append(edi_service_pb2.ProcessingMessage(
-                level=edi_service_pb2.MESSAGE_LEVEL_ERROR,
+            messages.append(_ProcessingMessage(
+                level=_ERROR,
                 code="NO_LINE_ITEMS",
                 message="Purchase Order must have at least one line item",
                 field="line_items"
             ))
             has_errors = True
         
-        # Validate line items
-        for i, line_item in enumerate(po_data.line_items):
-            if not line_item.line_number:
-                messages.append(edi_service_pb2.ProcessingMessage(
-                    level=edi_service_pb2.MESSAGE_LEVEL_ERROR,
+        # Validate line items; a well-formed PO is scanned by a single
+        # comprehension and messages are only built for the offenders
+        offenders = [
+            (i, not line_item.line_number, line_item.quantity_ordered.value <= 0)
+            for i, line_item in enumerate(po_data.line_items)
+            if not line_item.line_number or line_item.quantity_ordered.value <= 0
+        ]
+        for i, missing_line_number, invalid_quantity in offenders:
+            if missing_line_number:
+                messages.append(_ProcessingMessage(
+                    level=_ERROR,
                     code="MISSING_LINE_NUMBER",
                     message=f"Line item {i+1} must have a line number",
                     field=f"line_items[{i}].line_number"
                 ))
-                has_errors = True
             
-            if line_item.quantity_ordered.value <= 0:
-                messages.append(edi_service_pb2.ProcessingMessage(
-                    level=edi_service_pb2.MESSAGE_LEVEL_ERROR,
+            if invalid_quantity:
+                messages.append(_ProcessingMessage(
+                    level=_ERROR,
                     code="INVALID_QUANTITY",
                     message=f"Line item {i+1} quantity must be greater than 0",
                     field=f"line_items[{i}].quantity_ordered"
                 ))
-                has_errors = True
+        if offenders:
+            has_errors = True
         
         return ValidationResult(is_valid=not has_errors, messages=messages, has_errors=has_errors)
     
@@ -389,8 +496,8 @@ class EdiValidator:
         
         # Invoice number must be present
         if not invoice_data.invoice_number:
-            messages.append(edi_service_pb2.ProcessingMessage(
-                level=edi_service_pb2.MESSAGE_LEVEL_ERROR,
+            messages.append(_ProcessingMessage(
+                level=_ERROR,
                 code="MISSING_INVOICE_NUMBER",
                 message="Invoice number is required",
                 field="invoice_number"
@@ -399,8 +506,8 @@ class EdiValidator:
         
         # Must have at least one line item
         if not invoice_data.line_items:
-            messages.append(edi_service_pb2.ProcessingMessage(
-                level=edi_service_pb2.MESSAGE_LEVEL_ERROR,
+            messages.append(_ProcessingMessage(
+                level=_ERROR,
                 code="NO_LINE_ITEMS",
                 message="Invoice must have at least one line item",
                 field="line_items"
@@ -416,8 +523,8 @@ class EdiValidator:
         
         # Shipment ID must be present
         if not asn_data.shipment_id:
-            messages.append(edi_service_pb2.ProcessingMessage(
-                level=edi_service_pb2.MESSAGE_LEVEL_ERROR,
+            messages.append(_ProcessingMessage(
+                level=_ERROR,
                 code="MISSING_SHIPMENT_ID",
                 message="Shipment ID is required",
                 field="shipment_id"
@@ -433,8 +540,8 @@ class EdiValidator:
         
         # Original transaction set ID must be present
         if not fa_data.original_transaction_set_id:
-            messages.append(edi_service_pb2.ProcessingMessage(
-                level=edi_service_pb2.MESSAGE_LEVEL_ERROR,
+            messages.append(_ProcessingMessage(
+                level=_ERROR,
                 code="MISSING_ORIGINAL_TRANSACTION_SET_ID",
                 message="Original transaction set ID is required",
                 field="original_transaction_set_id"
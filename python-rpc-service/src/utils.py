@@ -3,8 +3,21 @@ Utility functions for the EDI service.
 """
 
 import os
+import time
 import logging
-from typing import Optional
+import threading
+from typing import Dict, Optional
+
+
+# gRPC message size limit shared by the server and clients; EDI documents
+# can be large, so allow up to 32 MB in either direction
+MAX_MESSAGE_LENGTH = 32 * 1024 * 1024
+
+# Loggers already configured by setup_logging, by name
+_LOGGER_CACHE: Dict[str, logging.Logger] = {}
+
+# Environment values get_env_bool treats as true (compared lowercased)
+_TRUE_VALUES = frozenset(('true', '1', 'yes', 'on'))
 
 
 def setup_logging(name: str, level: Optional[str] = None) -> logging.Logger:
@@ -18,6 +31,10 @@ def setup_logging(name: str, level: Optional[str] = None) -> logging.Logger:
     Returns:
         Configured logger
     """
+    cached = _LOGGER_CACHE.get(name)
+    if cached is not None:
+        return cached
+    
     logger = logging.getLogger(name)
     
     if not logger.handlers:
@@ -38,6 +55,7 @@ def setup_logging(name: str, level: Optional[str] = None) -> logging.Logger:
         # Add handler to logger
         logger.addHandler(handler)
     
+    _LOGGER_CACHE[name] = logger
     return logger
 
 
@@ -52,8 +70,10 @@ def get_env_bool(key: str, default: bool = False) -> bool:
     Returns:
         Boolean value
     """
-    value = os.getenv(key, str(default)).lower()
-    return value in ('true', '1', 'yes', 'on')
+    value = os.getenv(key)
+    if value is None:
+        return default
+    return value.lower() in _TRUE_VALUES
 
 
 def get_env_int(key: str, default: int = 0) -> int:
@@ -85,3 +105,54 @@ def get_env_str(key: str, default: str = "") -> str:
         String value
     """
     return os.getenv(key, default)
+
+
+class TracebackLimiter:
+    """Allow at most a fixed number of full tracebacks per second."""
+    
+    def __init__(self, rate: int = 10):
+        """
+        Initialize the limiter.
+        
+        Args:
+            rate: Maximum number of tracebacks allowed per one-second window
+        """
+        self.rate = rate
+        self._window_start = 0.0
+        self._count = 0
+        self._lock = threading.Lock()
+    
+    def should_log(self) -> bool:
+        """Return True if another traceback may be logged in the current window."""
+        now = time.monotonic()
+        with self._lock:
+            if now - self._window_start >= 1.0:
+                self._window_start = now
+                self._count = 0
+            if self._count < self.rate:
+                self._count += 1
+                return True
+            return False
+
+
+# Shared by every module so a failure storm is bounded process-wide
+_traceback_limiter = TracebackLimiter(get_env_int("EDI_TRACEBACKS_PER_SECOND", 10))
+
+
+def log_exception(logger: logging.Logger, msg: str, error: BaseException) -> None:
+    """
+    Log an error, including its traceback only while the rate limit allows.
+    
+    Formatting a traceback walks the stack and reads source lines, so under a
+    burst of failures only the first few per second carry one; the rest log
+    the exception type and message.
+    
+    Args:
+        logger: Logger to write to
+        msg: %-style message with a single placeholder for the error
+        error: The exception being reported
+    """
+    if _traceback_limiter.should_log():
+        logger.error(msg, error, exc_info=error)
+    else:
+        logger.error(msg + " (%s; traceback suppressed)", error, type(error).__name__)
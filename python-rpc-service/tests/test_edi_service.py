@@ -4,15 +4,22 @@ Basic tests for the EDI service.
 """
 
 import sys
+import logging
 import unittest
 from pathlib import Path
+from unittest import mock
+
+import grpc
 
 # Add the project root to the Python path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
+from generated import edi_service_pb2
 from src.edi_parser import EdiParser
+from src.edi_service import EdiServiceServicer, add_servicer_to_server
 from src.edi_validator import EdiValidator
+from src.utils import TracebackLimiter, log_exception
 from examples.test_messages import TEST_MESSAGES
 
 
@@ -41,14 +48,45 @@ class TestEdiParser(unittest.TestCase):
         self.assertFalse(result.success)
         self.assertIsNotNone(result.error_message)
     
+    def test_parse_messages_batch(self):
+        """Test parsing a batch of EDI messages of one type."""
+        edi_messages = [TEST_MESSAGES["850"], TEST_MESSAGES["810"], TEST_MESSAGES["850"]]
+        results = self.parser.parse_messages(edi_messages, "850")
+        
+        self.assertEqual(len(results), 3)
+        self.assertTrue(all(result.success for result in results))
+        self.assertEqual(results[0].data, results[2].data)
+        self.assertEqual(len(results[1].data.line_items), 0)
+    
     def test_split_into_segments(self):
         """Test splitting EDI message into segments."""
         edi_message = TEST_MESSAGES["850"]
         segments = self.parser._split_into_segments(edi_message)
         
         self.assertGreater(len(segments), 0)
-        self.assertEqual(segments[0]["segment_id"], "ISA")
-        self.assertEqual(segments[-1]["segment_id"], "IEA")
+        self.assertEqual(segments.segment_ids[0], "ISA")
+        self.assertEqual(segments.segment_ids[-1], "IEA")
+    
+    def test_stream_parser_unterminated_chunks(self):
+        """Test streaming many small chunks that complete no segment."""
+        edi_message = TEST_MESSAGES["850"]
+        long_segment = "REF*ZZ*" + "X" * 100000
+        header, _, rest = edi_message.partition("BEG*")
+        streamed = header + long_segment + "~\nBEG*" + rest
+        
+        stream = self.parser.create_stream_parser("850")
+        stream.feed(header)
+        for start in range(0, len(long_segment), 100):
+            stream.feed(long_segment[start:start + 100])
+        self.assertEqual(len(stream._segments), header.count("~"))
+        stream.feed("~\nBEG*" + rest)
+        result = stream.finish()
+        
+        expected = self.parser.parse_message(streamed, "850")
+        self.assertTrue(result.success)
+        self.assertEqual(result.data, expected.data)
+        self.assertEqual(list(result.segments), list(expected.segments))
+        self.assertEqual(stream._pending, [])
 
 
 class TestEdiValidator(unittest.TestCase):
@@ -65,6 +103,7 @@ class TestEdiValidator(unittest.TestCase):
         
         self.assertTrue(result.is_valid)
         self.assertFalse(result.has_errors)
+        self.assertEqual(len(result.messages), 0)
     
     def test_validate_invalid_format(self):
         """Test validating invalid EDI format."""
@@ -75,6 +114,80 @@ class TestEdiValidator(unittest.TestCase):
         self.assertTrue(result.has_errors)
         self.assertGreater(len(result.messages), 0)
     
+    def test_validate_fatal_isa_stops_early(self):
+        """Test that a fatal ISA error is the only message reported."""
+        lines = TEST_MESSAGES["850"].split("\n")
+        not_isa = "\n".join(["ISB" + lines[0][3:]] + lines[1:])
+        short_isa = "\n".join(["*".join(lines[0].split("*")[:10]) + "~"] + lines[1:])
+        
+        for edi_message, code in ((not_isa, "INVALID_ISA_SEGMENT"), (short_isa, "INSUFFICIENT_ISA_ELEMENTS")):
+            with self.subTest(code):
+                result = self.validator.validate_format(edi_message, "850")
+                
+                self.assertFalse(result.is_valid)
+                self.assertTrue(result.has_errors)
+                self.assertEqual([(message.code, message.field) for message in result.messages], [(code, "ISA")])
+    
+    def test_validate_short_message_stops_early(self):
+        """Test that fewer than three segments report only missing segments."""
+        edi_message = "\n".join(TEST_MESSAGES["850"].split("\n")[:2])
+        result = self.validator.validate_format(edi_message, "850")
+        
+        self.assertFalse(result.is_valid)
+        self.assertTrue(result.has_errors)
+        self.assertEqual(
+            [(message.code, message.field) for message in result.messages],
+            [("MISSING_REQUIRED_SEGMENT", segment_id) for segment_id in ("ST", "BEG", "SE", "GE", "IEA")]
+        )
+    
+    def test_validate_isa_control_number_length(self):
+        """Test that ISA13 accepts a 9-digit control number and no more."""
+        edi_message = TEST_MESSAGES["850"]
+        self.assertIn("*000000001*0*P*", edi_message)
+        
+        result = self.validator.validate_format(edi_message, "850")
+        self.assertNotIn("ISA.13", [message.field for message in result.messages])
+        
+        too_long = edi_message.replace("*000000001*0*P*", "*0000000001*0*P*", 1)
+        result = self.validator.validate_format(too_long, "850")
+        self.assertEqual(
+            [(message.code, message.field) for message in result.messages],
+            [("ISA_ELEMENT_TOO_LONG", "ISA.13")]
+        )
+    
+    def test_validate_format_cached(self):
+        """Test that repeated validations return independent copies."""
+        edi_message = TEST_MESSAGES["850"]
+        first = self.validator.validate_format(edi_message, "850")
+        expected_codes = [message.code for message in first.messages]
+        first.messages.clear()
+        second = self.validator.validate_format(edi_message, "850")
+        
+        self.assertTrue(second.is_valid)
+        self.assertEqual([message.code for message in second.messages], expected_codes)
+        self.assertEqual(len(self.validator._format_cache), 1)
+    
+    def test_segments_match_parser(self):
+        """Test that the validator and parser split segments the same way."""
+        parser = EdiParser()
+        edi_message = TEST_MESSAGES["850"]
+        variants = {
+            "tilde": edi_message.replace("~\n", "~"),
+            "crlf": edi_message.replace("\n", "\r\n"),
+            "cr": edi_message.replace("~\n", "\r"),
+        }
+        
+        for name, variant in variants.items():
+            with self.subTest(name):
+                parsed = parser._split_into_segments(variant)
+                validated = list(self.validator._iter_segments(variant))
+                
+                self.assertEqual([segment[0] for segment in validated], parsed.segment_ids)
+                self.assertEqual([segment[1] for segment in validated], parsed.elements)
+                self.assertEqual([segment[2] for segment in validated], parsed.line_numbers)
+                self.assertEqual(len(parsed), edi_message.count("~"))
+                self.assertTrue(self.validator.validate_format(variant, "850").is_valid)
+    
     def test_detect_edi_version(self):
         """Test detecting EDI version."""
         edi_message = TEST_MESSAGES["850"]
@@ -82,6 +195,18 @@ class TestEdiValidator(unittest.TestCase):
         
         self.assertEqual(version, "005010")
     
+    def test_detect_edi_version_truncated_isa(self):
+        """Test that a truncated, newline-terminated ISA is not read past."""
+        isa, _, rest = TEST_MESSAGES["850"].replace("~", "").partition("\n")
+        truncated = "*".join(isa.split("*")[:11])
+        
+        # The ISA stops after ISA10, so counting on across the line break
+        # would land on the GS sender ID and read it as ISA12
+        rest = rest.replace("GS*PO*SENDER*", "GS*PO*00501*", 1)
+        for line_break in ("\n", "\r\n", "\r"):
+            edi_message = truncated + line_break + rest.replace("\n", line_break)
+            self.assertEqual(self.validator.detect_edi_version(edi_message), "Unknown")
+    
     def test_detect_message_type(self):
         """Test detecting message type."""
         edi_message = TEST_MESSAGES["850"]
@@ -90,5 +215,145 @@ class TestEdiValidator(unittest.TestCase):
         self.assertEqual(message_type, "850")
 
 
+class TestLogException(unittest.TestCase):
+    """Test cases for rate-limited exception logging."""
+    
+    def test_tracebacks_limited_per_window(self):
+        """Test that only the first tracebacks in each window are logged in full."""
+        logger = logging.getLogger("test_edi_service.log_exception")
+        error = ValueError("bad segment")
+        
+        with mock.patch("src.utils._traceback_limiter", TracebackLimiter(rate=2)), \
+                mock.patch("src.utils.time.monotonic", return_value=100.0) as monotonic:
+            with self.assertLogs(logger, level="ERROR") as logs:
+                for _ in range(4):
+                    log_exception(logger, "Processing failed: %s", error)
+                monotonic.return_value = 101.5
+                log_exception(logger, "Processing failed: %s", error)
+        
+        self.assertEqual([record.exc_info is not None for record in logs.records], [True, True, False, False, True])
+        self.assertEqual(
+            [record.getMessage() for record in logs.records[2:4]],
+            ["Processing failed: bad segment (ValueError; traceback suppressed)"] * 2
+        )
+
+
+class TestEdiServiceServicer(unittest.IsolatedAsyncioTestCase):
+    """Test cases for the EDI service."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.servicer = EdiServiceServicer()
+    
+    async def test_process_edi_message_batch(self):
+        """Test processing a batch of EDI messages."""
+        request = edi_service_pb2.ProcessEdiMessageBatchRequest(requests=[
+            edi_service_pb2.ProcessEdiMessageRequest(edi_message=TEST_MESSAGES["850"], message_type="850"),
+            edi_service_pb2.ProcessEdiMessageRequest(edi_message=TEST_MESSAGES["850"], message_type="999"),
+            edi_service_pb2.ProcessEdiMessageRequest(edi_message=TEST_MESSAGES["810"], message_type="810"),
+        ])
+        response = await self.servicer.ProcessEdiMessageBatch(request, mock.Mock())
+        
+        statuses = [r.status for r in response.responses]
+        self.assertEqual(statuses, [
+            edi_service_pb2.PROCESSING_STATUS_SUCCESS,
+            edi_service_pb2.PROCESSING_STATUS_UNSUPPORTED_MESSAGE_TYPE,
+            edi_service_pb2.PROCESSING_STATUS_SUCCESS,
+        ])
+        self.assertTrue(response.responses[0].HasField("purchase_order"))
+        self.assertTrue(response.responses[2].HasField("invoice"))
+        self.assertEqual(len({r.processed_at for r in response.responses}), 1)
+    
+    async def test_process_edi_message_too_large(self):
+        """Test rejecting an EDI message over the size limit before parsing."""
+        servicer = EdiServiceServicer(max_edi_message_bytes=100)
+        context = mock.Mock()
+        request = edi_service_pb2.ProcessEdiMessageRequest(edi_message=TEST_MESSAGES["850"], message_type="850")
+        
+        response = await servicer.ProcessEdiMessage(request, context)
+        
+        self.assertEqual(response.status, edi_service_pb2.PROCESSING_STATUS_VALIDATION_ERROR)
+        self.assertEqual(response.messages[0].code, "MESSAGE_TOO_LARGE")
+        self.assertFalse(response.HasField("purchase_order"))
+        context.set_code.assert_called_once_with(grpc.StatusCode.INVALID_ARGUMENT)
+    
+    async def test_process_edi_message_too_large_utf8(self):
+        """Test that the size limit counts UTF-8 bytes, not characters."""
+        edi_message = TEST_MESSAGES["850"].replace("SENDER", "S\u00c9NDER")
+        limit = len(edi_message.encode("utf-8")) - 1
+        self.assertLessEqual(len(edi_message), limit)
+        servicer = EdiServiceServicer(max_edi_message_bytes=limit)
+        request = edi_service_pb2.ProcessEdiMessageRequest(edi_message=edi_message, message_type="850")
+        
+        response = await servicer.ProcessEdiMessage(request, mock.Mock())
+        
+        self.assertEqual(response.messages[0].code, "MESSAGE_TOO_LARGE")
+        self.assertEqual(
+            response.messages[0].message,
+            f"EDI message is {limit + 1} bytes; the limit is {limit}"
+        )
+    
+    async def test_process_edi_message_stream(self):
+        """Test processing an EDI message streamed in chunks."""
+        edi_message = TEST_MESSAGES["850"]
+        
+        async def chunks():
+            options = edi_service_pb2.ProcessingOptions(include_raw_segments=True)
+            yield edi_service_pb2.EdiChunk(content=edi_message[:37], message_type="850", options=options)
+            for start in range(37, len(edi_message), 64):
+                yield edi_service_pb2.EdiChunk(content=edi_message[start:start + 64])
+        
+        response = await self.servicer.ProcessEdiMessageStream(chunks(), mock.Mock())
+        
+        expected = EdiParser().parse_message(edi_message, "850")
+        self.assertEqual(response.status, edi_service_pb2.PROCESSING_STATUS_SUCCESS)
+        self.assertEqual(response.purchase_order, expected.data)
+        self.assertEqual(list(response.parsed_segments), list(expected.segments))
+    
+    async def test_process_edi_message_stream_large_chunks(self):
+        """Test that large stream chunks are split in the executor."""
+        edi_message = TEST_MESSAGES["850"]
+        
+        async def chunks():
+            options = edi_service_pb2.ProcessingOptions(include_raw_segments=True)
+            yield edi_service_pb2.EdiChunk(content=edi_message[:37], message_type="850", options=options)
+            yield edi_service_pb2.EdiChunk(content=edi_message[37:])
+        
+        run_blocking = mock.AsyncMock(wraps=self.servicer._run_blocking)
+        with mock.patch("src.edi_service.STREAM_FEED_EXECUTOR_THRESHOLD", 64), \
+                mock.patch.object(self.servicer, "_run_blocking", run_blocking):
+            response = await self.servicer.ProcessEdiMessageStream(chunks(), mock.Mock())
+        
+        fed_in_executor = [call.args[1] for call in run_blocking.await_args_list if call.args[0].__name__ == "feed"]
+        self.assertEqual(fed_in_executor, [edi_message[37:]])
+        expected = EdiParser().parse_message(edi_message, "850")
+        self.assertEqual(response.status, edi_service_pb2.PROCESSING_STATUS_SUCCESS)
+        self.assertEqual(response.purchase_order, expected.data)
+        self.assertEqual(list(response.parsed_segments), list(expected.segments))
+    
+    async def test_supported_message_types_served_pre_serialized(self):
+        """Test that the cached bytes handler answers GetSupportedMessageTypes."""
+        serialized = mock.AsyncMock(wraps=self.servicer._get_supported_message_types_serialized)
+        self.servicer._get_supported_message_types_serialized = serialized
+        server = grpc.aio.server()
+        add_servicer_to_server(self.servicer, server)
+        port = server.add_insecure_port("localhost:0")
+        await server.start()
+        try:
+            async with grpc.aio.insecure_channel(f"localhost:{port}") as channel:
+                get_supported_types = channel.unary_unary(
+                    "/" + edi_service_pb2.DESCRIPTOR.services_by_name["EdiService"].full_name + "/GetSupportedMessageTypes",
+                    request_serializer=edi_service_pb2.GetSupportedMessageTypesRequest.SerializeToString,
+                )
+                response_bytes = await get_supported_types(edi_service_pb2.GetSupportedMessageTypesRequest())
+        finally:
+            await server.stop(None)
+        
+        expected = await self.servicer.GetSupportedMessageTypes(edi_service_pb2.GetSupportedMessageTypesRequest(), mock.Mock())
+        serialized.assert_awaited_once()
+        self.assertEqual(edi_service_pb2.GetSupportedMessageTypesResponse.FromString(response_bytes), expected)
+        self.assertEqual(response_bytes, expected.SerializeToString())
+
+
 if __name__ == "__main__":
     unittest.main()